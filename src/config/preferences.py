@@ -8,9 +8,11 @@ Handles saving and loading user-specific preferences like:
 - UI state
 """
 
+import hashlib
 import json
+import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from ..utils.logger import logger
 
 
@@ -36,6 +38,8 @@ class PreferencesManager:
         
         self.preferences_file = Path(preferences_file)
         self.preferences: Dict[str, Any] = {}
+        # Digest of the preferences as last loaded from or written to disk
+        self._saved_digest: Optional[bytes] = None
         self._load_preferences()
     
     def _load_preferences(self) -> None:
@@ -44,6 +48,7 @@ class PreferencesManager:
             if self.preferences_file.exists():
                 with open(self.preferences_file, 'r', encoding='utf-8') as f:
                     self.preferences = json.load(f)
+                self._saved_digest = self._digest(self._serialize())
                 logger.info(f"Loaded preferences from {self.preferences_file}")
             else:
                 logger.info("No preferences file found, using defaults")
@@ -71,19 +76,41 @@ class PreferencesManager:
             }
         }
     
+    def _serialize(self) -> str:
+        """Serialize preferences as they are written to the file."""
+        return json.dumps(self.preferences, indent=2)
+    
+    @staticmethod
+    def _digest(data: str) -> bytes:
+        """Get a digest of serialized preferences."""
+        return hashlib.blake2b(data.encode('utf-8'), digest_size=16).digest()
+    
     def save(self) -> bool:
         """
         Save preferences to file.
         
+        Nothing is written if the preferences are unchanged since they were
+        last loaded or saved. Otherwise the file is written to a temporary
+        file next to it and renamed over it, so a crash mid-write never
+        leaves a truncated preferences file.
+        
         Returns:
-            True if saved successfully, False otherwise
+            True if saved successfully (or already up to date), False otherwise
         """
         try:
+            data = self._serialize()
+            digest = self._digest(data)
+            if digest == self._saved_digest and self.preferences_file.exists():
+                return True
+            
             # Ensure parent directory exists
             self.preferences_file.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(self.preferences_file, 'w', encoding='utf-8') as f:
-                json.dump(self.preferences, f, indent=2)
+            tmp_file = self.preferences_file.with_name(self.preferences_file.name + ".tmp")
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_file, self.preferences_file)
+            self._saved_digest = digest
             
             logger.info(f"Saved preferences to {self.preferences_file}")
             return True
@@ -155,6 +182,25 @@ class PreferencesManager:
         
         self.set("recent_files", recent)
     
+    def add_recent_files(self, filepaths: Iterable[Path], max_recent: int = 10) -> None:
+        """
+        Add several files to recent files list in one update.
+        
+        The result is the same as calling add_recent_file for each file in
+        order, so the last file given ends up first.
+        
+        Args:
+            filepaths: Paths to files
+            max_recent: Maximum number of recent files to keep
+        """
+        added = [str(filepath.absolute()) for filepath in filepaths]
+        recent = self.get("recent_files", [])
+        
+        # Newest first; dict keeps the first occurrence of duplicates
+        merged = dict.fromkeys(added[::-1] + recent)
+        
+        self.set("recent_files", list(merged)[:max_recent])
+    
     def add_recent_directory(self, dirpath: Path, max_recent: int = 10) -> None:
         """
         Add a directory to recent directories list.
@@ -43,10 +43,11 @@ class PDFDocument:
         
         self.file_path = Path(file_path)
 
-        if not self.file_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
-
+        # Only look for the cause when the check fails, so a valid file
+        # is stat'ed once
         if not is_valid_pdf(self.file_path):
+            if not self.file_path.exists():
+                raise FileNotFoundError(f"File not found: {file_path}")
             raise ValueError(f"Invalid PDF file: {file_path}")
 
         self.reader: Optional[PyPDF2.PdfReader] = None
@@ -54,11 +55,16 @@ class PDFDocument:
         self._load()
 
     def _load(self) -> None:
-        """Load the PDF file."""
+        """
+        Load the PDF file.
+
+        The reader is given the path rather than an open file handle so it
+        reads the file into memory once; pages are parsed lazily, which
+        would fail on a handle closed after loading.
+        """
         try:
-            with open(self.file_path, "rb") as f:
-                self.reader = PyPDF2.PdfReader(f)
-                self._extract_metadata()
+            self.reader = PyPDF2.PdfReader(self.file_path)
+            self._extract_metadata()
             logger.info(f"Loaded PDF: {self.file_path}")
         except Exception as e:
             logger.error(f"Error loading PDF {self.file_path}: {e}")
@@ -2,6 +2,7 @@
 PDF merging functionality
 """
 
+import os
 from pathlib import Path
 from typing import List, Union
 
@@ -65,19 +66,31 @@ class PDFMerger:
         """
         Merge all PDFs in the queue and save to output file.
 
+        The merged PDF is written to a temporary file next to the output
+        and renamed over it when complete, so a merge that fails or is cut
+        short (e.g. the app exits while it runs in the background) never
+        leaves a truncated output or destroys an existing file.
+
         Args:
             output_path: Path for the merged PDF
 
         Returns:
             True if successful, False otherwise
         """
+        output_path = Path(output_path)
+        tmp_path = output_path.with_name(output_path.name + ".tmp")
         try:
-            with open(output_path, "wb") as output_file:
+            with open(tmp_path, "wb") as output_file:
                 self.merger.write(output_file)
+            os.replace(tmp_path, output_path)
             logger.info(f"Merged PDF saved to {output_path}")
             return True
         except Exception as e:
             logger.error(f"Error merging PDFs: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
             return False
         finally:
             self.merger.close()
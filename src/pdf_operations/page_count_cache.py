@@ -0,0 +1,133 @@
+"""
+Persistent cache of PDF page counts.
+
+Counting the pages of a PDF means opening and parsing it. Counts are kept
+on disk keyed by the file's path, modification time and size, so files
+that haven't changed are not parsed again when a folder is reloaded.
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+from ..utils.logger import logger
+
+
+class PageCountCache:
+    """
+    Page counts of PDF files, persisted to a JSON file.
+    
+    An entry is only returned while the file's modification time and size
+    still match the ones it was stored with. Safe to use from worker threads.
+    """
+    
+    MAX_ENTRIES = 5000
+    
+    def __init__(self, cache_file: Optional[Path] = None, flush_every: int = 50):
+        """
+        Initialize the page count cache.
+        
+        Args:
+            cache_file: Path to the cache file.
+                        Defaults to ~/.pdf-manipulate/page_counts.json
+            flush_every: Number of new entries after which the cache is
+                         written to disk without waiting for save()
+        """
+        if cache_file is None:
+            cache_file = Path.home() / ".pdf-manipulate" / "page_counts.json"
+        
+        self.cache_file = Path(cache_file)
+        self.flush_every = flush_every
+        # Absolute path -> [mtime_ns, size, page_count], oldest first
+        self._entries: Dict[str, List[int]] = {}
+        self._loaded = False
+        self._unsaved = 0
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+    
+    def _load(self):
+        """Read the cache file on first use (caller holds the lock)."""
+        self._loaded = True
+        try:
+            if self.cache_file.exists():
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    entries = json.load(f)
+                if isinstance(entries, dict):
+                    self._entries = entries
+        except Exception as e:
+            logger.warning(f"Could not read page count cache: {e}")
+    
+    def get(self, file_path: str, mtime_ns: int, size: int) -> Optional[int]:
+        """
+        Get the cached page count of a file.
+        
+        Args:
+            file_path: Path to the PDF file
+            mtime_ns: Current modification time of the file (st_mtime_ns)
+            size: Current size of the file in bytes
+        
+        Returns:
+            Page count, or None if not cached or the file has changed
+        """
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            entry = self._entries.get(os.path.abspath(file_path))
+        if entry and entry[0] == mtime_ns and entry[1] == size:
+            return entry[2]
+        return None
+    
+    def put(self, file_path: str, mtime_ns: int, size: int, page_count: int):
+        """
+        Store the page count of a file.
+        
+        Args:
+            file_path: Path to the PDF file
+            mtime_ns: Modification time the count was read at (st_mtime_ns)
+            size: Size of the file in bytes when the count was read
+            page_count: Number of pages
+        """
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            key = os.path.abspath(file_path)
+            # Re-insert so the entry moves to the newest end
+            self._entries.pop(key, None)
+            self._entries[key] = [mtime_ns, size, page_count]
+            while len(self._entries) > self.MAX_ENTRIES:
+                del self._entries[next(iter(self._entries))]
+            self._unsaved += 1
+            flush = self._unsaved >= self.flush_every
+        
+        if flush:
+            self.save()
+    
+    def save(self) -> bool:
+        """
+        Write the cache to disk if it has new entries.
+        
+        Returns:
+            True if saved successfully (or nothing to save), False otherwise
+        """
+        with self._save_lock:
+            with self._lock:
+                if not self._unsaved:
+                    return True
+                data = json.dumps(self._entries)
+                self._unsaved = 0
+            
+            try:
+                self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file = self.cache_file.with_name(self.cache_file.name + ".tmp")
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                os.replace(tmp_file, self.cache_file)
+                return True
+            except Exception as e:
+                logger.error(f"Error saving page count cache: {e}")
+                return False
+
+
+# Global page count cache instance
+page_count_cache = PageCountCache()
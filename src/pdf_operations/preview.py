@@ -6,7 +6,7 @@ for PDF pages. It includes caching for performance optimization.
 """
 
 import os
-from io import BytesIO
+import threading
 from pathlib import Path
 from typing import Optional, Tuple, Dict
 from PIL import Image
@@ -26,9 +26,13 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# MuPDF isn't safe to call from several threads at once; pages rendered in
+# the background (e.g. prefetched neighbours) take turns with the UI thread
+_PYMUPDF_LOCK = threading.Lock()
+
 
 class PreviewCache:
-    """Simple in-memory cache for preview images."""
+    """Simple in-memory cache for preview images, safe to share between threads."""
     
     def __init__(self, max_size: int = 50):
         """
@@ -40,6 +44,7 @@ class PreviewCache:
         self.cache: Dict[str, Image.Image] = {}
         self.max_size = max_size
         self.access_order: list = []
+        self._lock = threading.Lock()
     
     def get(self, key: str) -> Optional[Image.Image]:
         """
@@ -51,11 +56,12 @@ class PreviewCache:
         Returns:
             Cached image or None if not found
         """
-        if key in self.cache:
-            # Update access order (LRU)
-            self.access_order.remove(key)
-            self.access_order.append(key)
-            return self.cache[key]
+        with self._lock:
+            if key in self.cache:
+                # Update access order (LRU)
+                self.access_order.remove(key)
+                self.access_order.append(key)
+                return self.cache[key]
         return None
     
     def put(self, key: str, image: Image.Image) -> None:
@@ -66,21 +72,23 @@ class PreviewCache:
             key: Cache key
             image: Image to cache
         """
-        if key in self.cache:
-            # Update existing
-            self.access_order.remove(key)
-        elif len(self.cache) >= self.max_size:
-            # Remove least recently used
-            lru_key = self.access_order.pop(0)
-            del self.cache[lru_key]
-        
-        self.cache[key] = image
-        self.access_order.append(key)
+        with self._lock:
+            if key in self.cache:
+                # Update existing
+                self.access_order.remove(key)
+            elif len(self.cache) >= self.max_size:
+                # Remove least recently used
+                lru_key = self.access_order.pop(0)
+                del self.cache[lru_key]
+            
+            self.cache[key] = image
+            self.access_order.append(key)
     
     def clear(self) -> None:
         """Clear all cached previews."""
-        self.cache.clear()
-        self.access_order.clear()
+        with self._lock:
+            self.cache.clear()
+            self.access_order.clear()
 
 
 class PDFPreviewGenerator:
@@ -102,6 +110,28 @@ class PDFPreviewGenerator:
         self.cache = PreviewCache(max_size=cache_size)
         self.prefer_pymupdf = PYMUPDF_AVAILABLE
     
+    @staticmethod
+    def _cache_key(pdf_path: str, page_number: int, variant: str) -> str:
+        """
+        Build the cache key of a rendered page.
+        
+        The key includes the file's modification time, so a PDF that is
+        rewritten (e.g. rotated and saved) isn't shown from stale renders.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            page_number: Page number (0-indexed)
+            variant: What was rendered, e.g. "thumb:200x200" or "preview:150"
+            
+        Returns:
+            Cache key
+        """
+        try:
+            mtime_ns = os.stat(pdf_path).st_mtime_ns
+        except OSError:
+            mtime_ns = 0
+        return f"{pdf_path}@{mtime_ns}:{page_number}:{variant}"
+    
     def generate_thumbnail(
         self,
         pdf_path: str,
@@ -122,7 +152,7 @@ class PDFPreviewGenerator:
             PIL Image object or None if generation fails
         """
         # Check cache
-        cache_key = f"{pdf_path}:{page_number}:thumb:{max_size[0]}x{max_size[1]}"
+        cache_key = self._cache_key(pdf_path, page_number, f"thumb:{max_size[0]}x{max_size[1]}")
         if use_cache:
             cached = self.cache.get(cache_key)
             if cached:
@@ -131,7 +161,10 @@ class PDFPreviewGenerator:
         # Generate new thumbnail
         try:
             if self.prefer_pymupdf:
-                image = self._generate_with_pymupdf(pdf_path, page_number, dpi=72)
+                # Rendered straight at the thumbnail size, not at 72 DPI and shrunk
+                image = self._generate_with_pymupdf(
+                    pdf_path, page_number, dpi=72, max_size=max_size
+                )
             else:
                 image = self._generate_with_pdf2image(pdf_path, page_number, dpi=72)
             
@@ -168,7 +201,7 @@ class PDFPreviewGenerator:
             PIL Image object or None if generation fails
         """
         # Check cache
-        cache_key = f"{pdf_path}:{page_number}:preview:{dpi}"
+        cache_key = self._cache_key(pdf_path, page_number, f"preview:{dpi}")
         if use_cache:
             cached = self.cache.get(cache_key)
             if cached:
@@ -193,7 +226,8 @@ class PDFPreviewGenerator:
         self,
         pdf_path: str,
         page_number: int,
-        dpi: int = 150
+        dpi: int = 150,
+        max_size: Optional[Tuple[int, int]] = None
     ) -> Optional[Image.Image]:
         """
         Generate preview using PyMuPDF (faster).
@@ -202,6 +236,8 @@ class PDFPreviewGenerator:
             pdf_path: Path to the PDF file
             page_number: Page number (0-indexed)
             dpi: Resolution for rendering
+            max_size: Maximum image dimensions (width, height); if given, the
+                page is rendered at a lower resolution where needed to fit
             
         Returns:
             PIL Image object or None
@@ -210,26 +246,29 @@ class PDFPreviewGenerator:
             return None
         
         try:
-            doc = fitz.open(pdf_path)
-            if page_number >= len(doc):
-                logger.warning(f"Page {page_number} does not exist in {pdf_path}")
+            with _PYMUPDF_LOCK:
+                doc = fitz.open(pdf_path)
+                if page_number >= len(doc):
+                    logger.warning(f"Page {page_number} does not exist in {pdf_path}")
+                    doc.close()
+                    return None
+                
+                page = doc[page_number]
+                
+                # Calculate zoom factor from DPI
+                zoom = dpi / 72  # 72 is the default DPI
+                if max_size:
+                    zoom = min(zoom, max_size[0] / page.rect.width, max_size[1] / page.rect.height)
+                mat = fitz.Matrix(zoom, zoom)
+                
+                # Render page to pixmap
+                pix = page.get_pixmap(matrix=mat, alpha=False)
+                
+                # Wrap the RGB samples directly: a fully decoded image, so
+                # pages rendered in the background need no work when shown
+                image = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
                 doc.close()
-                return None
-            
-            page = doc[page_number]
-            
-            # Calculate zoom factor from DPI
-            zoom = dpi / 72  # 72 is the default DPI
-            mat = fitz.Matrix(zoom, zoom)
-            
-            # Render page to pixmap
-            pix = page.get_pixmap(matrix=mat)
-            
-            # Convert to PIL Image
-            img_data = pix.tobytes("ppm")
-            image = Image.open(BytesIO(img_data))
             
-            doc.close()
             return image
         except Exception as e:
             logger.error(f"PyMuPDF preview generation failed: {e}")
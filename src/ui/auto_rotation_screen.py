@@ -8,23 +8,28 @@ and manually adjusting them before applying.
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
+from functools import partial
 from typing import List, Optional
+import importlib.util
 import threading
 
-try:
-    from PIL import Image, ImageTk
-    from pdf2image import convert_from_path
-    PREVIEW_AVAILABLE = True
-except ImportError:
-    PREVIEW_AVAILABLE = False
-
 from ..pdf_operations.batch_rotator import BatchRotationProcessor, PDFRotationJob
 from ..utils.logger import logger
-from .undo_redo import UndoRedoManager, RotationAction
+from .undo_redo import UndoRedoManager, RotationAction, get_session_log_path, prune_session_logs
 from .keyboard_shortcuts import create_shortcuts_manager
 from .tooltip import create_tooltip
 
 
+def __getattr__(name):
+    """Compute PREVIEW_AVAILABLE on access without importing PIL/pdf2image."""
+    if name == "PREVIEW_AVAILABLE":
+        return all(
+            importlib.util.find_spec(module) is not None
+            for module in ("PIL", "pdf2image")
+        )
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class AutoRotationScreen(ttk.Frame):
     """
     Screen for reviewing and manually overriding auto-detected rotations.
@@ -44,9 +49,13 @@ class AutoRotationScreen(ttk.Frame):
         self.current_page_idx = 0
         self.is_paused = False
         self.processing_thread = None
+        self._last_tree_sig = None
         
-        # Undo/redo manager
-        self.undo_manager = UndoRedoManager(max_history=50)
+        # Undo/redo manager (history persisted across sessions). Only actions
+        # on queued files can be undone; the queue starts empty
+        prune_session_logs()
+        self.undo_manager = UndoRedoManager(max_history=50, log_file=get_session_log_path())
+        self.undo_manager.restrict_to_files([])
         
         # Keyboard shortcuts
         self.shortcuts = create_shortcuts_manager(parent)
@@ -54,6 +63,7 @@ class AutoRotationScreen(ttk.Frame):
         
         self._create_widgets()
         self._layout_widgets()
+        self._update_undo_redo_buttons()
         
     def _create_widgets(self):
         """Create all UI widgets"""
@@ -61,46 +71,23 @@ class AutoRotationScreen(ttk.Frame):
         # Top toolbar
         self.toolbar = ttk.Frame(self)
         
-        self.btn_add_files = ttk.Button(
-            self.toolbar,
-            text="📁 Add Files...",
-            command=self._add_files
+        # (attribute, text, command, tooltip, initial state)
+        toolbar_buttons = (
+            ("btn_add_files", "📁 Add Files...", self._add_files,
+             "Add PDF files to process", tk.NORMAL),
+            ("btn_add_folder", "📂 Add Folder...", self._add_folder,
+             "Add all PDFs from a folder", tk.NORMAL),
+            ("btn_clear", "🗑️ Clear All", self._clear_all,
+             "Clear all files from queue", tk.NORMAL),
+            ("btn_undo", "↶ Undo", self._undo,
+             f"Undo last rotation ({self.shortcuts.get_display_text('undo')})", tk.DISABLED),
+            ("btn_redo", "↷ Redo", self._redo,
+             f"Redo rotation ({self.shortcuts.get_display_text('redo')})", tk.DISABLED),
         )
-        create_tooltip(self.btn_add_files, "Add PDF files to process")
+        self._create_buttons(self.toolbar, toolbar_buttons)
         
-        self.btn_add_folder = ttk.Button(
-            self.toolbar,
-            text="📂 Add Folder...",
-            command=self._add_folder
-        )
-        create_tooltip(self.btn_add_folder, "Add all PDFs from a folder")
-        
-        self.btn_clear = ttk.Button(
-            self.toolbar,
-            text="🗑️ Clear All",
-            command=self._clear_all
-        )
-        create_tooltip(self.btn_clear, "Clear all files from queue")
-        
-        # Separator
-        ttk.Separator(self.toolbar, orient=tk.VERTICAL).pack(side=tk.LEFT, fill=tk.Y, padx=5)
-        
-        # Undo/Redo buttons
-        self.btn_undo = ttk.Button(
-            self.toolbar,
-            text="↶ Undo",
-            command=self._undo,
-            state=tk.DISABLED
-        )
-        create_tooltip(self.btn_undo, f"Undo last rotation ({self.shortcuts.get_display_text('undo')})")
-        
-        self.btn_redo = ttk.Button(
-            self.toolbar,
-            text="↷ Redo",
-            command=self._redo,
-            state=tk.DISABLED
-        )
-        create_tooltip(self.btn_redo, f"Redo rotation ({self.shortcuts.get_display_text('redo')})")
+        # Separator between file and undo/redo buttons
+        self.toolbar_separator = ttk.Separator(self.toolbar, orient=tk.VERTICAL)
         
         # Main content area (split into two panes)
         self.paned_window = ttk.PanedWindow(self, orient=tk.HORIZONTAL)
@@ -135,6 +122,11 @@ class AutoRotationScreen(ttk.Frame):
         self.file_tree.column("rotation", width=80)
         self.file_tree.column("confidence", width=80)
         
+        # Row styles by confidence, applied via tags at insert time
+        self.file_tree.tag_configure('hi', background='#d4f7d4')
+        self.file_tree.tag_configure('lo', background='#fff3cd')
+        self.file_tree.tag_configure('err', background='#f8d7da')
+        
         self.file_tree.bind("<<TreeviewSelect>>", self._on_tree_select)
         
         # Right pane: Preview and controls
@@ -165,21 +157,21 @@ class AutoRotationScreen(ttk.Frame):
         self.btn_rotate_left = ttk.Button(
             self.controls_frame,
             text="⟲ Rotate Left (90°)",
-            command=lambda: self._manual_rotate(-90)
+            command=partial(self._manual_rotate, -90)
         )
         self.btn_rotate_left.grid(row=1, column=0, padx=2)
         
         self.btn_rotate_180 = ttk.Button(
             self.controls_frame,
             text="⟳ Rotate 180°",
-            command=lambda: self._manual_rotate(180)
+            command=partial(self._manual_rotate, 180)
         )
         self.btn_rotate_180.grid(row=1, column=1, padx=2)
         
         self.btn_rotate_right = ttk.Button(
             self.controls_frame,
             text="⟳ Rotate Right (90°)",
-            command=lambda: self._manual_rotate(90)
+            command=partial(self._manual_rotate, 90)
         )
         self.btn_rotate_right.grid(row=1, column=2, padx=2)
         
@@ -199,51 +191,43 @@ class AutoRotationScreen(ttk.Frame):
             textvariable=self.progress_var
         )
         
-        # Accept All / Review Each buttons
-        self.btn_accept_all = ttk.Button(
-            self.action_bar,
-            text="✓ Accept All",
-            command=self._accept_all,
-            state=tk.DISABLED
-        )
-        create_tooltip(self.btn_accept_all, "Accept all auto-rotation suggestions and process")
-        
-        self.btn_review_each = ttk.Button(
-            self.action_bar,
-            text="👁 Review Each",
-            command=self._review_each,
-            state=tk.DISABLED
+        # Accept All / Review Each / Pause / Process buttons
+        action_buttons = (
+            ("btn_accept_all", "✓ Accept All", self._accept_all,
+             "Accept all auto-rotation suggestions and process", tk.DISABLED),
+            ("btn_review_each", "👁 Review Each", self._review_each,
+             "Review each page one by one", tk.DISABLED),
+            ("btn_pause_resume", "⏸ Pause", self._toggle_pause,
+             "Pause/Resume processing", tk.DISABLED),
+            ("btn_process", "▶ Process All", self._process_all,
+             "Process all files with current settings", tk.DISABLED),
         )
-        create_tooltip(self.btn_review_each, "Review each page one by one")
+        self._create_buttons(self.action_bar, action_buttons)
         
-        # Pause/Resume button
-        self.btn_pause_resume = ttk.Button(
-            self.action_bar,
-            text="⏸ Pause",
-            command=self._toggle_pause,
-            state=tk.DISABLED
-        )
-        create_tooltip(self.btn_pause_resume, "Pause/Resume processing")
+    def _create_buttons(self, parent, specs):
+        """
+        Create buttons with tooltips from a table of specs.
         
-        self.btn_process = ttk.Button(
-            self.action_bar,
-            text="▶ Process All",
-            command=self._process_all,
-            state=tk.DISABLED
-        )
-        create_tooltip(self.btn_process, "Process all files with current settings")
+        Args:
+            parent: Parent frame for the buttons
+            specs: Iterable of (attribute, text, command, tooltip, state) tuples
+        """
+        for attr, text, command, tip, state in specs:
+            button = ttk.Button(parent, text=text, command=command, state=state)
+            setattr(self, attr, button)
+            create_tooltip(button, tip)
         
     def _layout_widgets(self):
         """Layout all widgets"""
         
         # Toolbar
         self.toolbar.pack(side=tk.TOP, fill=tk.X, padx=5, pady=5)
-        self.btn_add_files.pack(side=tk.LEFT, padx=2)
-        self.btn_add_folder.pack(side=tk.LEFT, padx=2)
-        self.btn_clear.pack(side=tk.LEFT, padx=2)
+        for button in (self.btn_add_files, self.btn_add_folder, self.btn_clear):
+            button.pack(side=tk.LEFT, padx=2)
         # Undo/redo are in toolbar frame, pack them after separator
-        self.btn_undo.pack(side=tk.LEFT, padx=2)
-        self.btn_redo.pack(side=tk.LEFT, padx=2)
+        self.toolbar_separator.pack(side=tk.LEFT, fill=tk.Y, padx=5)
+        for button in (self.btn_undo, self.btn_redo):
+            button.pack(side=tk.LEFT, padx=2)
         
         # Main content
         self.paned_window.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=5, pady=5)
@@ -260,10 +244,9 @@ class AutoRotationScreen(ttk.Frame):
         # Action bar
         self.action_bar.pack(side=tk.BOTTOM, fill=tk.X, padx=5, pady=5)
         self.progress_label.pack(side=tk.LEFT, padx=5)
-        self.btn_process.pack(side=tk.RIGHT, padx=2)
-        self.btn_pause_resume.pack(side=tk.RIGHT, padx=2)
-        self.btn_review_each.pack(side=tk.RIGHT, padx=2)
-        self.btn_accept_all.pack(side=tk.RIGHT, padx=2)
+        for button in (self.btn_process, self.btn_pause_resume,
+                       self.btn_review_each, self.btn_accept_all):
+            button.pack(side=tk.RIGHT, padx=2)
         
     def _add_files(self):
         """Add PDF files to the queue"""
@@ -281,6 +264,7 @@ class AutoRotationScreen(ttk.Frame):
                     messagebox.showerror("Error", f"Failed to add {file}:\n{e}")
             
             self._refresh_tree()
+            self._restrict_undo_to_queue()
             
     def _add_folder(self):
         """Add all PDFs from a folder"""
@@ -291,6 +275,7 @@ class AutoRotationScreen(ttk.Frame):
             try:
                 self.processor.add_directory(folder, recursive=False)
                 self._refresh_tree()
+                self._restrict_undo_to_queue()
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to add folder:\n{e}")
     
@@ -298,11 +283,19 @@ class AutoRotationScreen(ttk.Frame):
         """Clear all files from the queue"""
         if messagebox.askyesno("Confirm", "Clear all files from the queue?"):
             self.processor = None
+            self._restrict_undo_to_queue()
+            self._last_tree_sig = None
             self.file_tree.delete(*self.file_tree.get_children())
             self.progress_var.set("No files loaded")
             self.btn_process.config(state=tk.DISABLED)
             self.preview_label.config(text="Select a page to preview", image="")
     
+    def _restrict_undo_to_queue(self):
+        """Offer undo/redo only for actions on files in the queue."""
+        jobs = self.processor.jobs if self.processor else []
+        self.undo_manager.restrict_to_files(job.pdf_path for job in jobs)
+        self._update_undo_redo_buttons()
+    
     def _initialize_processor(self):
         """Initialize the batch processor if not already done"""
         if self.processor is None:
@@ -311,6 +304,26 @@ class AutoRotationScreen(ttk.Frame):
                 backup_originals=True
             )
     
+    def _ensure_preview_libs(self) -> bool:
+        """
+        Import the preview libraries on first use.
+        
+        PIL and pdf2image are only needed once a page is previewed, so they
+        are kept out of the screen's import path.
+        
+        Returns:
+            True if the preview libraries are available
+        """
+        if not hasattr(self, '_Image'):
+            try:
+                from PIL import Image, ImageTk
+                from pdf2image import convert_from_path
+                self._Image, self._ImageTk, self._convert = Image, ImageTk, convert_from_path
+            except ImportError:
+                logger.warning("Preview libraries not available (Pillow, pdf2image)")
+                self._Image = None
+        return self._Image is not None
+    
     def _on_tree_select(self, event):
         """Handle tree selection"""
         # For now, just show a message
@@ -318,11 +331,16 @@ class AutoRotationScreen(ttk.Frame):
         selection = self.file_tree.selection()
         if selection:
             item = self.file_tree.item(selection[0])
+            if not self._ensure_preview_libs():
+                self.preview_label.config(
+                    text=f"Preview for: {item['text']}\n(Preview requires Pillow and pdf2image)"
+                )
+                return
             self.preview_label.config(
                 text=f"Preview for: {item['text']}\n(Preview generation not yet implemented)"
             )
     
-    def _manual_rotate(self, angle: int):
+    def _manual_rotate(self, angle: int, event=None):
         """Apply manual rotation to selected page"""
         messagebox.showinfo(
             "Manual Rotation",
@@ -399,8 +417,8 @@ class AutoRotationScreen(ttk.Frame):
         """Setup keyboard shortcuts"""
         self.shortcuts.bind('undo', self._undo)
         self.shortcuts.bind('redo', self._redo)
-        self.shortcuts.bind('rotate_right', lambda e: self._manual_rotate(90))
-        self.shortcuts.bind('rotate_left', lambda e: self._manual_rotate(-90))
+        self.shortcuts.bind('rotate_right', partial(self._manual_rotate, 90))
+        self.shortcuts.bind('rotate_left', partial(self._manual_rotate, -90))
         self.shortcuts.bind('accept', self._accept_all)
         self.shortcuts.bind('next', self._next_page)
         self.shortcuts.bind('prev', self._prev_page)
@@ -500,11 +518,38 @@ class AutoRotationScreen(ttk.Frame):
             self.btn_pause_resume.config(text="⏸ Pause")
             logger.info("Processing resumed")
     
+    def _tree_signature(self):
+        """
+        Get a cheap fingerprint of the processor state shown in the tree.
+        
+        Returns:
+            Tuple identifying the jobs and their suggested rotations, or None
+            if there is nothing to show
+        """
+        if not self.processor or not self.processor.jobs:
+            return None
+        jobs = self.processor.jobs
+        return (
+            len(jobs),
+            tuple(id(job) for job in jobs),
+            sum(page.suggested_angle for job in jobs for page in job.pages),
+        )
+    
+    def destroy(self):
+        """Close the undo log before closing the screen."""
+        self.undo_manager.close()
+        super().destroy()
+    
     def _refresh_tree(self):
         """Refresh the file tree with current processor state"""
+        sig = self._tree_signature()
+        if sig == self._last_tree_sig:
+            return
+        self._last_tree_sig = sig
+        
         self.file_tree.delete(*self.file_tree.get_children())
         
-        if not self.processor or not self.processor.jobs:
+        if sig is None:
             return
         
         # Add jobs to tree
@@ -524,6 +569,12 @@ class AutoRotationScreen(ttk.Frame):
             
             # Add page nodes
             for page in job.pages:
+                if page.status == "error":
+                    tag = 'err'
+                elif page.auto_rotate:
+                    tag = 'hi'
+                else:
+                    tag = 'lo'
                 self.file_tree.insert(
                     file_node,
                     tk.END,
@@ -532,7 +583,8 @@ class AutoRotationScreen(ttk.Frame):
                         "",
                         f"{page.suggested_angle}°" if page.suggested_angle != 0 else "OK",
                         f"{page.confidence:.1%}"
-                    )
+                    ),
+                    tags=(tag,)
                 )
         
         # Update status and enable buttons
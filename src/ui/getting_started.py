@@ -7,10 +7,240 @@ and helps users get started quickly.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+from typing import List, Optional
 from ..config.preferences import preferences
 from ..utils.logger import logger
 
 
+# Static page content, shared by every wizard instance
+_PAGE_TITLES = (
+    "Welcome to PDF Manipulate!",
+    "Key Features",
+    "Auto-Rotation Feature",
+    "PDF Merging Feature",
+    "Smart Naming Templates",
+    "You're All Set!",
+)
+
+_WELCOME_TEXT = """This wizard will guide you through the main features of PDF Manipulate.
+
+PDF Manipulate helps you:
+
+• Automatically detect and rotate incorrectly oriented pages
+• Merge multiple PDF files with live previews
+• Use smart naming templates with date arithmetic
+• Manage your PDF workflow efficiently
+
+The application is designed to save you time and make PDF manipulation tasks easy and intuitive.
+
+Click "Next" to learn about the key features."""
+
+_FEATURES = (
+    ("🔄 Auto-Rotation",
+     "Detect and rotate pages using OCR technology.\n"
+     "Review suggestions before applying."),
+
+    ("🔗 PDF Merging",
+     "Select and merge PDFs in any order.\n"
+     "Preview pages before merging."),
+
+    ("📝 Smart Naming",
+     "Use templates with date arithmetic.\n"
+     "Example: {date+7}_{name}.pdf"),
+
+    ("⚙️ Preferences",
+     "Customize settings to your workflow.\n"
+     "Save window positions and recent files."),
+)
+
+_AUTO_ROTATION_TEXT = """HOW AUTO-ROTATION WORKS:
+
+1. Add Files
+   Click "Add Files" or "Add Folder" to select PDFs
+
+2. Automatic Detection
+   The application scans each page using OCR to detect orientation
+   Confidence scores show how certain the detection is
+
+3. Review Options
+   • Accept All - Process all files with suggested rotations
+   • Review Each - Go through pages one by one
+   • Manual Override - Rotate specific pages manually
+
+4. Process
+   Apply rotations and save to output directory
+
+KEYBOARD SHORTCUTS:
+   Ctrl+R - Rotate right
+   Ctrl+Shift+R - Rotate left
+   Ctrl+Z - Undo
+   Ctrl+Y - Redo
+
+Access: Tools → Auto-Rotate (Ctrl+Alt+R)"""
+
+_MERGE_TEXT = """HOW TO MERGE PDFs:
+
+1. Open Merge Screen
+   Tools → Merge PDFs (Ctrl+M)
+
+2. Select Files
+   • Click "Open Folder" to browse PDFs
+   • Double-click files to add to merge queue
+
+3. Preview Pages
+   • Click a file to see thumbnail
+   • Double-click for full-page preview
+
+4. Arrange Order
+   • Use "Move Up/Down" buttons to reorder
+   • Or drag files in the queue
+
+5. Merge & Name
+   • Click "Merge Selected"
+   • Choose output directory
+   • Use naming templates for smart file names
+
+FEATURES:
+   ✓ Preserves bookmarks and metadata
+   ✓ Handles different page sizes
+   ✓ Live preview before merging"""
+
+_NAMING_TEXT = """NAMING TEMPLATE SYNTAX:
+
+Available Variables:
+   {date}       - Current date (2026-01-06)
+   {date+N}     - Date plus N days ({date+7} = 2026-01-13)
+   {date-N}     - Date minus N days ({date-30} = 2025-12-07)
+   {name}       - User-provided name
+   {filename}   - Original filename
+   {timestamp}  - Full timestamp
+   {counter}    - Sequential counter (001, 002, ...)
+
+Template Examples:
+
+Invoice_{date+7}_{name}.pdf
+   → Invoice_2026-01-13_ClientA.pdf
+
+{date}_Report_{counter}.pdf
+   → 2026-01-06_Report_001.pdf
+
+Contract_{name}_{date}.pdf
+   → Contract_NewClient_2026-01-06.pdf
+
+Configure Templates:
+   Edit → Settings → Naming tab
+   Add custom templates for quick access"""
+
+_COMPLETE_TEXT = """Quick Start Tips:
+
+1. Press F1 anytime for help
+2. Use Ctrl+O to quickly open files
+3. View logs: Help → View Logs
+4. Customize settings: Edit → Settings
+5. Check keyboard shortcuts in Help
+
+Need More Help?
+• Visit: https://github.com/McJono/pdf-manipulate
+• Check the docs/ folder for detailed guides
+• View FAQ.md for common questions
+
+Thank you for using PDF Manipulate!
+
+Click "Finish" to start working with your PDFs."""
+
+
+def _add_body_text(page: ttk.Frame, text: str, pady: int) -> None:
+    """Add a wrapping read-only text label to a page frame."""
+    ttk.Label(
+        page,
+        text=text,
+        wraplength=640,
+        justify=tk.LEFT,
+        anchor=tk.NW,
+        font=("Arial", 10)
+    ).pack(fill=tk.BOTH, expand=True, pady=pady)
+
+
+def _build_welcome(parent: ttk.Frame) -> ttk.Frame:
+    """Build the welcome page frame"""
+    page = ttk.Frame(parent)
+    
+    # Subtitle
+    ttk.Label(
+        page,
+        text="Your intelligent PDF manipulation assistant",
+        font=("Arial", 12)
+    ).pack(pady=(0, 30))
+    
+    _add_body_text(page, _WELCOME_TEXT, pady=20)
+    return page
+
+
+def _build_features(parent: ttk.Frame) -> ttk.Frame:
+    """Build the features overview page frame"""
+    page = ttk.Frame(parent)
+    
+    # Feature list
+    features_frame = ttk.Frame(page)
+    features_frame.pack(fill=tk.BOTH, expand=True, pady=10)
+    
+    for title_text, desc in _FEATURES:
+        # Feature frame
+        feature_frame = ttk.LabelFrame(
+            features_frame,
+            text=title_text,
+            padding=10
+        )
+        feature_frame.pack(fill=tk.X, pady=5)
+        
+        ttk.Label(
+            feature_frame,
+            text=desc,
+            justify=tk.LEFT
+        ).pack(anchor=tk.W)
+    
+    return page
+
+
+def _build_auto_rotation(parent: ttk.Frame) -> ttk.Frame:
+    """Build the auto-rotation feature page frame"""
+    page = ttk.Frame(parent)
+    _add_body_text(page, _AUTO_ROTATION_TEXT, pady=10)
+    return page
+
+
+def _build_merge(parent: ttk.Frame) -> ttk.Frame:
+    """Build the merge feature page frame"""
+    page = ttk.Frame(parent)
+    _add_body_text(page, _MERGE_TEXT, pady=10)
+    return page
+
+
+def _build_naming(parent: ttk.Frame) -> ttk.Frame:
+    """Build the naming templates page frame"""
+    page = ttk.Frame(parent)
+    _add_body_text(page, _NAMING_TEXT, pady=10)
+    return page
+
+
+def _build_complete(parent: ttk.Frame) -> ttk.Frame:
+    """Build the completion page frame"""
+    page = ttk.Frame(parent)
+    _add_body_text(page, _COMPLETE_TEXT, pady=20)
+    return page
+
+
+# Page builders in wizard order; index matches _PAGE_TITLES
+_PAGE_BUILDERS = (
+    _build_welcome,
+    _build_features,
+    _build_auto_rotation,
+    _build_merge,
+    _build_naming,
+    _build_complete,
+)
+
+
 class GettingStartedWizard(tk.Toplevel):
     """
     Multi-step wizard to introduce new users to the application.
@@ -28,27 +258,25 @@ class GettingStartedWizard(tk.Toplevel):
         super().__init__(parent)
         
         self.title("Getting Started - PDF Manipulate")
-        self.geometry("700x500")
         self.transient(parent)
         self.resizable(False, False)
         
-        # Center window
-        self.update_idletasks()
+        # Center window; screen dimensions don't need the window realized,
+        # so size and position are set in a single geometry call
         x = (self.winfo_screenwidth() // 2) - (700 // 2)
         y = (self.winfo_screenheight() // 2) - (500 // 2)
         self.geometry(f"700x500+{x}+{y}")
         
         self.current_page = 0
-        self.pages = [
-            self._create_welcome_page,
-            self._create_features_page,
-            self._create_auto_rotation_page,
-            self._create_merge_page,
-            self._create_naming_page,
-            self._create_complete_page,
-        ]
+        self.pages = _PAGE_BUILDERS
+        self._num_pages = len(self.pages)
         
         self._create_widgets()
+        
+        # Pages are built on first view and kept; navigation only swaps
+        # which one is packed
+        self._page_frames: List[Optional[ttk.Frame]] = [None] * self._num_pages
+        self._current_frame = None
         self._show_page(0)
     
     def _create_widgets(self):
@@ -57,12 +285,21 @@ class GettingStartedWizard(tk.Toplevel):
         self.content_frame = ttk.Frame(self, padding=30)
         self.content_frame.pack(fill=tk.BOTH, expand=True)
         
+        # Title bar shared by all pages
+        self.title_label = ttk.Label(self.content_frame, font=("Arial", 20, "bold"))
+        self.title_label.pack(pady=(10, 20))
+        
+        # Body frame the page frames are swapped in
+        self.body_frame = ttk.Frame(self.content_frame)
+        self.body_frame.pack(fill=tk.BOTH, expand=True)
+        
         # Navigation frame
         self.nav_frame = ttk.Frame(self, padding=10)
         self.nav_frame.pack(side=tk.BOTTOM, fill=tk.X)
         
         # Page indicator
-        self.page_indicator = ttk.Label(self.nav_frame, text="")
+        self._step_var = tk.StringVar()
+        self.page_indicator = ttk.Label(self.nav_frame, textvariable=self._step_var)
         self.page_indicator.pack(side=tk.LEFT, padx=10)
         
         # Buttons
@@ -75,9 +312,10 @@ class GettingStartedWizard(tk.Toplevel):
         )
         self.btn_prev.pack(side=tk.RIGHT, padx=5)
         
+        self._next_text = tk.StringVar(value="Next →")
         self.btn_next = ttk.Button(
             self.nav_frame,
-            text="Next →",
+            textvariable=self._next_text,
             command=self._next_page,
             width=12
         )
@@ -94,13 +332,15 @@ class GettingStartedWizard(tk.Toplevel):
     
     def _show_page(self, page_num):
         """Show specific page"""
-        # Clear current content
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        
-        # Create new page
+        # Swap the visible page frame
+        if self._current_frame is not None:
+            self._current_frame.pack_forget()
         self.current_page = page_num
-        self.pages[page_num]()
+        if self._page_frames[page_num] is None:
+            self._page_frames[page_num] = self.pages[page_num](self.body_frame)
+        self._current_frame = self._page_frames[page_num]
+        self._current_frame.pack(fill=tk.BOTH, expand=True)
+        self.title_label.config(text=_PAGE_TITLES[page_num])
         
         # Update navigation
         self._update_navigation()
@@ -108,9 +348,7 @@ class GettingStartedWizard(tk.Toplevel):
     def _update_navigation(self):
         """Update navigation buttons and page indicator"""
         # Update page indicator
-        self.page_indicator.config(
-            text=f"Step {self.current_page + 1} of {len(self.pages)}"
-        )
+        self._step_var.set(f"Step {self.current_page + 1} of {self._num_pages}")
         
         # Update previous button
         if self.current_page == 0:
@@ -119,14 +357,16 @@ class GettingStartedWizard(tk.Toplevel):
             self.btn_prev.config(state=tk.NORMAL)
         
         # Update next button
-        if self.current_page == len(self.pages) - 1:
-            self.btn_next.config(text="Finish", command=self._finish)
+        if self.current_page == self._num_pages - 1:
+            self._next_text.set("Finish")
+            self.btn_next.config(command=self._finish)
         else:
-            self.btn_next.config(text="Next →", command=self._next_page)
+            self._next_text.set("Next →")
+            self.btn_next.config(command=self._next_page)
     
     def _next_page(self):
         """Go to next page"""
-        if self.current_page < len(self.pages) - 1:
+        if self.current_page < self._num_pages - 1:
             self._show_page(self.current_page + 1)
     
     def _prev_page(self):
@@ -136,287 +376,13 @@ class GettingStartedWizard(tk.Toplevel):
     
     def _finish(self):
         """Finish wizard"""
-        # Save preference if user checked "don't show again"
-        if self.dont_show_var.get():
+        # Save preference if user checked "don't show again" and it changed
+        if self.dont_show_var.get() and preferences.get("ui_state.show_getting_started", True):
             preferences.set("ui_state.show_getting_started", False)
             preferences.save()
             logger.info("User disabled getting started wizard")
         
         self.destroy()
-    
-    def _create_welcome_page(self):
-        """Create welcome page"""
-        # Title
-        title = ttk.Label(
-            self.content_frame,
-            text="Welcome to PDF Manipulate!",
-            font=("Arial", 20, "bold")
-        )
-        title.pack(pady=(20, 10))
-        
-        # Subtitle
-        subtitle = ttk.Label(
-            self.content_frame,
-            text="Your intelligent PDF manipulation assistant",
-            font=("Arial", 12)
-        )
-        subtitle.pack(pady=(0, 30))
-        
-        # Welcome text
-        welcome_text = tk.Text(
-            self.content_frame,
-            wrap=tk.WORD,
-            height=12,
-            font=("Arial", 10),
-            relief=tk.FLAT,
-            bg=self.cget('bg')
-        )
-        welcome_text.pack(fill=tk.BOTH, expand=True, pady=20)
-        
-        content = """This wizard will guide you through the main features of PDF Manipulate.
-
-PDF Manipulate helps you:
-
-• Automatically detect and rotate incorrectly oriented pages
-• Merge multiple PDF files with live previews
-• Use smart naming templates with date arithmetic
-• Manage your PDF workflow efficiently
-
-The application is designed to save you time and make PDF manipulation tasks easy and intuitive.
-
-Click "Next" to learn about the key features."""
-        
-        welcome_text.insert("1.0", content)
-        welcome_text.config(state=tk.DISABLED)
-    
-    def _create_features_page(self):
-        """Create features overview page"""
-        title = ttk.Label(
-            self.content_frame,
-            text="Key Features",
-            font=("Arial", 18, "bold")
-        )
-        title.pack(pady=(10, 20))
-        
-        # Feature list
-        features_frame = ttk.Frame(self.content_frame)
-        features_frame.pack(fill=tk.BOTH, expand=True, pady=10)
-        
-        features = [
-            ("🔄 Auto-Rotation", 
-             "Detect and rotate pages using OCR technology.\n"
-             "Review suggestions before applying."),
-            
-            ("🔗 PDF Merging", 
-             "Select and merge PDFs in any order.\n"
-             "Preview pages before merging."),
-            
-            ("📝 Smart Naming", 
-             "Use templates with date arithmetic.\n"
-             "Example: {date+7}_{name}.pdf"),
-            
-            ("⚙️ Preferences", 
-             "Customize settings to your workflow.\n"
-             "Save window positions and recent files."),
-        ]
-        
-        for i, (title_text, desc) in enumerate(features):
-            # Feature frame
-            feature_frame = ttk.LabelFrame(
-                features_frame,
-                text=title_text,
-                padding=10
-            )
-            feature_frame.pack(fill=tk.X, pady=5)
-            
-            ttk.Label(
-                feature_frame,
-                text=desc,
-                justify=tk.LEFT
-            ).pack(anchor=tk.W)
-    
-    def _create_auto_rotation_page(self):
-        """Create auto-rotation feature page"""
-        title = ttk.Label(
-            self.content_frame,
-            text="Auto-Rotation Feature",
-            font=("Arial", 18, "bold")
-        )
-        title.pack(pady=(10, 20))
-        
-        text = tk.Text(
-            self.content_frame,
-            wrap=tk.WORD,
-            height=15,
-            font=("Arial", 10),
-            relief=tk.FLAT,
-            bg=self.cget('bg')
-        )
-        text.pack(fill=tk.BOTH, expand=True, pady=10)
-        
-        content = """HOW AUTO-ROTATION WORKS:
-
-1. Add Files
-   Click "Add Files" or "Add Folder" to select PDFs
-
-2. Automatic Detection
-   The application scans each page using OCR to detect orientation
-   Confidence scores show how certain the detection is
-
-3. Review Options
-   • Accept All - Process all files with suggested rotations
-   • Review Each - Go through pages one by one
-   • Manual Override - Rotate specific pages manually
-
-4. Process
-   Apply rotations and save to output directory
-
-KEYBOARD SHORTCUTS:
-   Ctrl+R - Rotate right
-   Ctrl+Shift+R - Rotate left
-   Ctrl+Z - Undo
-   Ctrl+Y - Redo
-
-Access: Tools → Auto-Rotate (Ctrl+Alt+R)"""
-        
-        text.insert("1.0", content)
-        text.config(state=tk.DISABLED)
-    
-    def _create_merge_page(self):
-        """Create merge feature page"""
-        title = ttk.Label(
-            self.content_frame,
-            text="PDF Merging Feature",
-            font=("Arial", 18, "bold")
-        )
-        title.pack(pady=(10, 20))
-        
-        text = tk.Text(
-            self.content_frame,
-            wrap=tk.WORD,
-            height=15,
-            font=("Arial", 10),
-            relief=tk.FLAT,
-            bg=self.cget('bg')
-        )
-        text.pack(fill=tk.BOTH, expand=True, pady=10)
-        
-        content = """HOW TO MERGE PDFs:
-
-1. Open Merge Screen
-   Tools → Merge PDFs (Ctrl+M)
-
-2. Select Files
-   • Click "Open Folder" to browse PDFs
-   • Double-click files to add to merge queue
-
-3. Preview Pages
-   • Click a file to see thumbnail
-   • Double-click for full-page preview
-
-4. Arrange Order
-   • Use "Move Up/Down" buttons to reorder
-   • Or drag files in the queue
-
-5. Merge & Name
-   • Click "Merge Selected"
-   • Choose output directory
-   • Use naming templates for smart file names
-
-FEATURES:
-   ✓ Preserves bookmarks and metadata
-   ✓ Handles different page sizes
-   ✓ Live preview before merging"""
-        
-        text.insert("1.0", content)
-        text.config(state=tk.DISABLED)
-    
-    def _create_naming_page(self):
-        """Create naming templates page"""
-        title = ttk.Label(
-            self.content_frame,
-            text="Smart Naming Templates",
-            font=("Arial", 18, "bold")
-        )
-        title.pack(pady=(10, 20))
-        
-        text = tk.Text(
-            self.content_frame,
-            wrap=tk.WORD,
-            height=15,
-            font=("Arial", 10),
-            relief=tk.FLAT,
-            bg=self.cget('bg')
-        )
-        text.pack(fill=tk.BOTH, expand=True, pady=10)
-        
-        content = """NAMING TEMPLATE SYNTAX:
-
-Available Variables:
-   {date}       - Current date (2026-01-06)
-   {date+N}     - Date plus N days ({date+7} = 2026-01-13)
-   {date-N}     - Date minus N days ({date-30} = 2025-12-07)
-   {name}       - User-provided name
-   {filename}   - Original filename
-   {timestamp}  - Full timestamp
-   {counter}    - Sequential counter (001, 002, ...)
-
-Template Examples:
-
-Invoice_{date+7}_{name}.pdf
-   → Invoice_2026-01-13_ClientA.pdf
-
-{date}_Report_{counter}.pdf
-   → 2026-01-06_Report_001.pdf
-
-Contract_{name}_{date}.pdf
-   → Contract_NewClient_2026-01-06.pdf
-
-Configure Templates:
-   Edit → Settings → Naming tab
-   Add custom templates for quick access"""
-        
-        text.insert("1.0", content)
-        text.config(state=tk.DISABLED)
-    
-    def _create_complete_page(self):
-        """Create completion page"""
-        title = ttk.Label(
-            self.content_frame,
-            text="You're All Set!",
-            font=("Arial", 20, "bold")
-        )
-        title.pack(pady=(30, 20))
-        
-        text = tk.Text(
-            self.content_frame,
-            wrap=tk.WORD,
-            height=12,
-            font=("Arial", 10),
-            relief=tk.FLAT,
-            bg=self.cget('bg')
-        )
-        text.pack(fill=tk.BOTH, expand=True, pady=20)
-        
-        content = """Quick Start Tips:
-
-1. Press F1 anytime for help
-2. Use Ctrl+O to quickly open files
-3. View logs: Help → View Logs
-4. Customize settings: Edit → Settings
-5. Check keyboard shortcuts in Help
-
-Need More Help?
-• Visit: https://github.com/McJono/pdf-manipulate
-• Check the docs/ folder for detailed guides
-• View FAQ.md for common questions
-
-Thank you for using PDF Manipulate!
-
-Click "Finish" to start working with your PDFs."""
-        
-        text.insert("1.0", content)
-        text.config(state=tk.DISABLED)
 
 
 def show_getting_started(parent=None):
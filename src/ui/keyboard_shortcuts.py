@@ -5,11 +5,56 @@ Provides centralized keyboard shortcut handling for consistent
 user experience across all screens.
 """
 
+import re
 import tkinter as tk
+from functools import lru_cache
 from typing import Callable, Dict, Optional
 from ..utils.logger import logger
 
 
+# Tkinter key notation -> display text, applied in a single regex pass
+_DISPLAY_MAP = {
+    'Control-': 'Ctrl+',
+    'Command-': 'Cmd+',
+    'Shift-': 'Shift+',
+    'Alt-': 'Alt+',
+    'Option-': 'Opt+',
+    'Return': 'Enter',
+    'Prior': 'PgUp',
+    'Next': 'PgDn',
+}
+_DISPLAY_PATTERN = re.compile(
+    '|'.join(map(re.escape, _DISPLAY_MAP)) + '|[<>]'
+)
+
+
+@lru_cache(maxsize=128)
+def _format_sequence(sequence: str) -> str:
+    """
+    Convert a Tkinter key sequence to display text (memoized).
+    
+    Args:
+        sequence: Tkinter event sequence (e.g., "<Control-o>")
+        
+    Returns:
+        Display text for the sequence (e.g., "Ctrl+o")
+    """
+    return _DISPLAY_PATTERN.sub(lambda m: _DISPLAY_MAP.get(m.group(0), ''), sequence)
+
+
+class _BreakWrapper:
+    """Callable that invokes a shortcut callback and stops further event handling."""
+    
+    __slots__ = ('cb',)
+    
+    def __init__(self, cb: Callable):
+        self.cb = cb
+    
+    def __call__(self, event=None):
+        self.cb(event)
+        return "break"
+
+
 class KeyboardShortcuts:
     """
     Manages keyboard shortcuts for the application.
@@ -79,6 +124,13 @@ class KeyboardShortcuts:
         'merge': '<Command-m>',
     }
     
+    # Resolved shortcut tables per platform, computed once at class creation
+    _RESOLVED = {
+        'darwin': {**SHORTCUTS, **SHORTCUTS_MAC},
+        'linux': SHORTCUTS,
+        'win32': SHORTCUTS,
+    }
+    
     def __init__(self, widget: tk.Widget, platform: str = 'linux'):
         """
         Initialize keyboard shortcuts manager.
@@ -91,11 +143,9 @@ class KeyboardShortcuts:
         self.platform = platform
         self.bindings: Dict[str, str] = {}
         
-        # Use macOS shortcuts on darwin
-        if platform == 'darwin':
-            self.shortcuts = {**self.SHORTCUTS, **self.SHORTCUTS_MAC}
-        else:
-            self.shortcuts = self.SHORTCUTS.copy()
+        # Shared by reference: instances only mutate self.bindings, never
+        # self.shortcuts, so no per-instance copy is needed
+        self.shortcuts = self._RESOLVED.get(platform, self.SHORTCUTS)
     
     def bind(self, action: str, callback: Callable, add: bool = True) -> Optional[str]:
         """
@@ -117,11 +167,7 @@ class KeyboardShortcuts:
         
         try:
             # Wrap callback to return "break" to prevent default handling
-            def wrapper(event=None):
-                callback(event)
-                return "break"
-            
-            self.widget.bind(sequence, wrapper, add=add)
+            self.widget.bind(sequence, _BreakWrapper(callback), add=add)
             self.bindings[action] = sequence
             logger.debug(f"Bound shortcut {sequence} to {action}")
             return sequence
@@ -168,18 +214,8 @@ class KeyboardShortcuts:
         if not sequence:
             return ""
         
-        # Convert Tkinter key notation to display text
-        text = sequence.replace('<', '').replace('>', '')
-        text = text.replace('Control-', 'Ctrl+')
-        text = text.replace('Command-', 'Cmd+')
-        text = text.replace('Shift-', 'Shift+')
-        text = text.replace('Alt-', 'Alt+')
-        text = text.replace('Option-', 'Opt+')
-        text = text.replace('Return', 'Enter')
-        text = text.replace('Prior', 'PgUp')
-        text = text.replace('Next', 'PgDn')
-        
-        return text
+        # Display text depends only on the sequence, so it is cached per sequence
+        return _format_sequence(sequence)
 
 
 def create_shortcuts_manager(widget: tk.Widget) -> KeyboardShortcuts:
@@ -6,13 +6,44 @@ directly from the UI.
 """
 
 import tkinter as tk
+import tkinter.font as tkfont
 from tkinter import ttk, messagebox, filedialog
 from pathlib import Path
-from typing import Optional
+from typing import Deque, Dict, List, Optional, Tuple
+from array import array
+from collections import deque
+import mmap
 import os
+import re
+import shutil
+from bisect import bisect_left, bisect_right
+from itertools import accumulate, islice, repeat
+from ..utils.background import io_pool
 from ..utils.logger import logger
 
 
+# Log levels that are highlighted and can be filtered on
+_LEVELS = ('ERROR', 'WARNING', 'INFO', 'DEBUG')
+
+# Log level of a line; the level column precedes the message, so the
+# leftmost match is the line's level
+_LEVEL_RE = re.compile(r'\b(' + '|'.join(_LEVELS) + r')\b')
+
+
+def _classify(line: str) -> Optional[str]:
+    """
+    Get the syntax-highlighting tag for a log line.
+    
+    Args:
+        line: Log line
+        
+    Returns:
+        Level tag name, or None if the line has no level
+    """
+    m = _LEVEL_RE.search(line)
+    return m.group(1) if m else None
+
+
 class LogViewerDialog(tk.Toplevel):
     """
     Dialog for viewing application logs.
@@ -23,8 +54,22 @@ class LogViewerDialog(tk.Toplevel):
     - Clear logs
     - Export logs
     - Auto-refresh
+    
+    Only the lines in view are inserted into the Text widget; the log is
+    kept as a bounded deque of its most recent lines and the scrollbar is
+    driven by line index.
     """
     
+    # Most recent log lines kept in memory; older lines are evicted
+    MAX_LINES = 200_000
+    
+    # Lines rendered below the viewport so small scrolls don't re-render
+    OVERSCAN = 20
+    
+    # Auto-refresh poll interval, and the cap it backs off to while idle
+    REFRESH_MS = 5000
+    MAX_REFRESH_MS = 30000
+    
     def __init__(self, parent, log_file: Optional[Path] = None):
         """
         Initialize log viewer.
@@ -42,6 +87,43 @@ class LogViewerDialog(tk.Toplevel):
         self.log_file = log_file
         self.auto_refresh_id = None
         self.auto_refresh_enabled = False
+        self._last_signature: Optional[Tuple[float, int]] = None
+        self._idle_polls = 0
+        
+        # Virtual view state (cached lines keep their line endings, tags
+        # are kept in step with them), and the number of lines in the file.
+        # Lines are classified lazily: a None tag means not classified yet,
+        # an empty tag means the line has no level
+        self._lines: Deque[str] = deque(maxlen=self.MAX_LINES)
+        self._line_tags: Deque[Optional[str]] = deque(maxlen=self.MAX_LINES)
+        self._first_line = 0
+        self._total_lines = 0
+        
+        # Absolute line numbers of the cached lines at each level, in order,
+        # built on first use of the level filter up to _level_indexed;
+        # _evicted is the absolute number of the first cached line
+        self._by_level: Dict[str, List[int]] = {level: [] for level in _LEVELS}
+        self._level_indexed = 0
+        self._evicted = 0
+        
+        # Character offset of each cached line, plus the end of the last
+        # one; offsets keep counting up as lines are evicted from the front
+        self._line_starts = array('q', [0])
+        
+        # Incremental read state: byte offset of the first unread line, and
+        # whether the last cached line is incomplete (no newline yet)
+        self._last_offset = 0
+        self._partial_line = False
+        
+        # Background loading state (only touched on the Tk main loop)
+        self._loading = False
+        self._reload_pending = False
+        self._load_generation = 0
+        
+        # Search state: (line index, column) of each match
+        self._search_term = ""
+        self._matches: List[Tuple[int, int]] = []
+        self._search_cache: Optional[Tuple[str, Optional[str]]] = None
         
         # Try to detect log file from logger if not provided
         if self.log_file is None:
@@ -104,6 +186,19 @@ class LogViewerDialog(tk.Toplevel):
         )
         self.btn_search.pack(side=tk.LEFT, padx=2)
         
+        ttk.Label(self.search_frame, text="Level:").pack(side=tk.LEFT, padx=(10, 5))
+        
+        self.level_var = tk.StringVar(value="ALL")
+        self.level_combo = ttk.Combobox(
+            self.search_frame,
+            textvariable=self.level_var,
+            values=("ALL",) + _LEVELS,
+            state="readonly",
+            width=9
+        )
+        self.level_combo.pack(side=tk.LEFT, padx=2)
+        self.level_combo.bind('<<ComboboxSelected>>', lambda e: self._on_level_changed())
+        
         # Separator
         ttk.Separator(self.toolbar, orient=tk.VERTICAL).pack(side=tk.LEFT, fill=tk.Y, padx=10, pady=5)
         
@@ -124,18 +219,34 @@ class LogViewerDialog(tk.Toplevel):
         # Log text area
         self.text_frame = ttk.Frame(self)
         
+        # Unwrapped monospace text: every log line is exactly one row of
+        # fixed height, so the widget acts as a recycled row view
         self.log_text = tk.Text(
             self.text_frame,
-            wrap=tk.WORD,
+            wrap=tk.NONE,
             font=("Courier", 9),
             bg="#f5f5f5"
         )
+        self._line_height = max(1, tkfont.Font(font=("Courier", 9)).metrics("linespace"))
         
+        # Scrollbar tracks the position in the full log, not the Text contents
         self.scrollbar = ttk.Scrollbar(
             self.text_frame,
-            command=self.log_text.yview
+            command=self._on_scroll
         )
-        self.log_text.config(yscrollcommand=self.scrollbar.set)
+        self.hscrollbar = ttk.Scrollbar(
+            self.text_frame,
+            orient=tk.HORIZONTAL,
+            command=self.log_text.xview
+        )
+        self.log_text.config(xscrollcommand=self.hscrollbar.set)
+        
+        self.log_text.bind("<MouseWheel>", self._on_mousewheel)
+        self.log_text.bind("<Button-4>", lambda e: self._scroll_lines(-3))
+        self.log_text.bind("<Button-5>", lambda e: self._scroll_lines(3))
+        self.log_text.bind("<Prior>", lambda e: self._scroll_pages(-1))
+        self.log_text.bind("<Next>", lambda e: self._scroll_pages(1))
+        self.log_text.bind("<Configure>", lambda e: self._render_window())
         
         # Configure tags for syntax highlighting
         self.log_text.tag_config("ERROR", foreground="red")
@@ -175,8 +286,9 @@ class LogViewerDialog(tk.Toplevel):
         
         # Text area
         self.text_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=5, pady=5)
-        self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.hscrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+        self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         # Status bar
         self.status_label.pack(side=tk.TOP, fill=tk.X, padx=5, pady=(0, 5))
@@ -185,54 +297,428 @@ class LogViewerDialog(tk.Toplevel):
         self.button_frame.pack(side=tk.BOTTOM, pady=5)
         self.btn_close.pack()
     
-    def _load_log(self):
-        """Load and display log file contents"""
-        if not self.log_file or not self.log_file.exists():
+    def _reset_cache(self):
+        """Forget cached log contents so the next load starts from byte 0"""
+        self._lines.clear()
+        self._line_tags.clear()
+        self._matches = []
+        self._first_line = 0
+        self._total_lines = 0
+        self._by_level = {level: [] for level in _LEVELS}
+        self._level_indexed = 0
+        self._evicted = 0
+        self._line_starts = array('q', [0])
+        self._last_offset = 0
+        self._partial_line = False
+        self._search_cache = None
+        # Results of reads started before the reset are discarded
+        self._load_generation += 1
+    
+    def _load_log(self, st: Optional[os.stat_result] = None):
+        """
+        Load new log file contents, reading only what was appended.
+        
+        The file is read on a background thread; the result
+        is applied on the Tk main loop by _apply_loaded. A refresh requested
+        while a read is in flight is run once that read completes.
+        
+        Args:
+            st: Result of a just-made os.stat of the log file, so it isn't
+                stat'ed again. If None, the file is stat'ed here
+        """
+        if st is None and self.log_file:
+            try:
+                st = os.stat(self.log_file)
+            except OSError:
+                st = None
+        
+        if st is None:
+            self._reset_cache()
             self.log_text.delete("1.0", tk.END)
             self.log_text.insert("1.0", "Log file not found")
+            self.scrollbar.set(0.0, 1.0)
             self.status_var.set("Log file not found")
             return
         
+        if self._loading:
+            self._reload_pending = True
+            return
+        
+        self._loading = True
+        io_pool.submit(
+            self._read_in_background, self._load_generation, self._last_offset, st.st_size
+        )
+    
+    def _read_in_background(self, generation: int, offset: int, file_size: int):
+        """Read the log tail off the Tk main loop and hand it back to it"""
+        result, error = None, None
         try:
-            # Read log file
-            with open(self.log_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Clear text area
-            self.log_text.delete("1.0", tk.END)
-            
-            # Insert content with syntax highlighting
-            lines = content.split('\n')
-            for line in lines:
-                # Determine line type and apply tag
-                tag = None
-                if 'ERROR' in line:
-                    tag = "ERROR"
-                elif 'WARNING' in line:
-                    tag = "WARNING"
-                elif 'INFO' in line:
-                    tag = "INFO"
-                elif 'DEBUG' in line:
-                    tag = "DEBUG"
-                
+            # File shrank: it was truncated or rotated, start over
+            reset = file_size < offset
+            if reset:
+                offset = 0
+            result = (file_size, reset) + self._read_tail(offset, file_size)
+        except Exception as e:
+            error = e
+        
+        try:
+            self.after(0, self._apply_loaded, generation, result, error)
+        except (RuntimeError, tk.TclError):
+            # Dialog was closed while reading
+            pass
+    
+    def _apply_loaded(self, generation: int, result, error: Optional[Exception]):
+        """Merge a background read into the line cache and re-render"""
+        self._loading = False
+        
+        if generation != self._load_generation:
+            # The cache was reset while reading; read again from scratch
+            self._load_log()
+            return
+        
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to load log file:\n{error}")
+            self.status_var.set(f"Error: {error}")
+        else:
+            self._merge_lines(*result)
+        
+        if self._reload_pending:
+            self._reload_pending = False
+            self._load_log()
+    
+    def _merge_lines(self, file_size: int, reset: bool, new_lines, line_count: int,
+                     end_offset: int, partial: bool):
+        """Append newly read lines to the cache and update the view"""
+        if reset:
+            self._reset_cache()
+        
+        first_load = not self._lines
+        following = first_load or (
+            self._first_line + self._visible_line_count() >= self._view_length()
+        )
+        
+        if not new_lines and not first_load:
+            return
+        
+        # Cached lines change below; drop the search buffer
+        self._search_cache = None
+        
+        # A previously incomplete last line is re-read in full
+        if self._partial_line:
+            self._lines.pop()
+            tag = self._line_tags.pop()
+            number = self._evicted + len(self._lines)
+            if number < self._level_indexed:
                 if tag:
-                    self.log_text.insert(tk.END, line + '\n', tag)
-                else:
-                    self.log_text.insert(tk.END, line + '\n')
-            
-            # Scroll to bottom
-            self.log_text.see(tk.END)
+                    self._by_level[tag].pop()
+                self._level_indexed = number
+            self._line_starts.pop()
+            self._total_lines -= 1
+        self._last_offset = end_offset
+        self._partial_line = partial
+        self._total_lines += line_count
+        
+        # Lines pushed out of the front of the deque shift every index
+        evicted = max(0, len(self._lines) + len(new_lines) - self.MAX_LINES)
+        if evicted:
+            self._matches = [(idx - evicted, col) for idx, col in self._matches
+                             if idx >= evicted]
+        
+        self._lines.extend(new_lines)
+        self._line_tags.extend(repeat(None, len(new_lines)))
+        
+        if evicted:
+            self._evict_levels(evicted)
+        
+        # Extend the line offset index once per merge; search reuses it
+        ends = accumulate(map(len, new_lines), initial=self._line_starts[-1])
+        self._line_starts.extend(islice(ends, 1, None))
+        if evicted:
+            del self._line_starts[:evicted]
+        
+        self._find_matches(len(self._lines) - min(len(new_lines), self.MAX_LINES))
+        
+        # Keep following the end of the log if it was in view
+        if following:
+            self._first_line = self._view_length()
+        self._render_window()
+        
+        # Update status
+        shown = len(self._lines)
+        if self._total_lines > shown:
+            lines_text = f"showing last {shown:,} of {self._total_lines:,} lines"
+        else:
+            lines_text = f"{shown:,} lines"
+        self.status_var.set(
+            f"Loaded: {self.log_file.name} ({file_size:,} bytes, {lines_text})"
+        )
+    
+    def _evict_levels(self, count: int):
+        """
+        Drop evicted lines from the per-level index and keep the view in place.
+        
+        Args:
+            count: Number of lines evicted from the front of the cache
+        """
+        level = self.level_var.get()
+        self._evicted += count
+        self._level_indexed = max(self._level_indexed, self._evicted)
+        for name, numbers in self._by_level.items():
+            dropped = bisect_left(numbers, self._evicted)
+            del numbers[:dropped]
+            if name == level:
+                self._first_line = max(0, self._first_line - dropped)
+        if level not in self._by_level:
+            self._first_line = max(0, self._first_line - count)
+    
+    def _view_rows(self) -> Optional[List[int]]:
+        """
+        Get the lines shown by the level filter.
+        
+        Returns:
+            Absolute line numbers at the selected level, or None when all
+            lines are shown
+        """
+        level = self.level_var.get()
+        if level not in self._by_level:
+            return None
+        self._index_levels()
+        return self._by_level[level]
+    
+    def _index_levels(self):
+        """Classify cached lines not yet in the per-level index and add them"""
+        start = self._level_indexed - self._evicted
+        count = len(self._lines) - start
+        if count <= 0:
+            return
+        
+        tags = []
+        window = islice(zip(self._lines, self._line_tags), start, None)
+        for number, (line, tag) in enumerate(window, self._level_indexed):
+            if tag is None:
+                tag = _classify(line) or ''
+            tags.append(tag)
+            if tag:
+                self._by_level[tag].append(number)
+        
+        # Store the tags computed on the way
+        for _ in range(count):
+            self._line_tags.pop()
+        self._line_tags.extend(tags)
+        self._level_indexed = self._evicted + len(self._lines)
+    
+    def _view_length(self) -> int:
+        """Number of lines in the (possibly filtered) view"""
+        rows = self._view_rows()
+        return len(self._lines) if rows is None else len(rows)
+    
+    def _on_level_changed(self):
+        """Show only lines at the selected level, from the end of the log"""
+        self._first_line = self._view_length()
+        self._render_window()
+        
+        level = self.level_var.get()
+        if level in self._by_level:
+            self.status_var.set(f"Showing {self._view_length():,} {level} line(s)")
+        else:
+            self.status_var.set(f"Showing all {len(self._lines):,} lines")
+    
+    def _read_tail(self, offset: int, file_size: int) -> Tuple[Deque[str], int, int, bool]:
+        """
+        Read the lines appended to the log file after a byte offset.
+        
+        The file is memory-mapped read-only for the duration of the read and
+        walked line by line. The mapping is not kept open between refreshes;
+        an open mapping would stop the file from being truncated on Windows.
+        Only the last MAX_LINES lines are returned, so reading a huge log
+        stays bounded.
+        
+        Args:
+            offset: Byte offset of the first unread line
+            file_size: Size of the log file when it was last stat'ed
             
-            # Update status
-            file_size = os.path.getsize(self.log_file)
-            line_count = len(lines)
-            self.status_var.set(
-                f"Loaded: {self.log_file.name} ({file_size:,} bytes, {line_count:,} lines)"
+        Returns:
+            Tuple of (last MAX_LINES lines, number of lines read, offset
+            after the last complete line, whether the last returned line is
+            incomplete)
+        """
+        lines = deque(maxlen=self.MAX_LINES)
+        line_count = 0
+        end = offset
+        partial = False
+        if file_size <= offset:
+            return lines, line_count, end, partial
+        with open(self.log_file, 'rb') as f:
+            try:
+                # Map only what was stat'ed; anything appended since is
+                # picked up by the next refresh
+                mm = mmap.mmap(f.fileno(), file_size, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Truncated since it was stat'ed; the next refresh starts over
+                return lines, line_count, end, partial
+            with mm:
+                mm.seek(offset)
+                for raw in iter(mm.readline, b''):
+                    lines.append(raw.decode('utf-8', errors='replace'))
+                    line_count += 1
+                    # Only complete lines advance the offset
+                    if raw.endswith(b'\n'):
+                        end += len(raw)
+                    else:
+                        partial = True
+        return lines, line_count, end, partial
+    
+    def _visible_line_count(self) -> int:
+        """Number of lines that fit in the Text widget viewport"""
+        return max(1, self.log_text.winfo_height() // self._line_height)
+    
+    def _render_window(self):
+        """Insert only the lines around the current view position"""
+        total = self._view_length()
+        if not total:
+            self.log_text.delete("1.0", tk.END)
+            self.scrollbar.set(0.0, 1.0)
+            return
+        
+        visible = self._visible_line_count()
+        first = max(0, min(self._first_line, total - visible))
+        last = min(total, first + visible + self.OVERSCAN)
+        self._first_line = first
+        
+        # Cache indices of the lines in the window
+        rows = self._view_rows()
+        if rows is None:
+            indices = range(first, last)
+        else:
+            indices = [number - self._evicted for number in rows[first:last]]
+        
+        # Coalesce consecutive lines with the same tag into runs, classifying
+        # only the lines in the window that haven't been yet
+        runs: List[Tuple[str, List[str]]] = []
+        for idx in indices:
+            line = self._lines[idx]
+            tag = self._line_tags[idx]
+            if tag is None:
+                tag = self._line_tags[idx] = _classify(line) or ''
+            if runs and runs[-1][0] == tag:
+                runs[-1][1].append(line)
+            else:
+                runs.append((tag, [line]))
+        
+        # Insert all runs in one call: insert(index, text, tags, text, tags, ...)
+        args = []
+        for tag, lines in runs:
+            args.append(''.join(lines))
+            args.append(tag or ())
+        self.log_text.delete("1.0", tk.END)
+        self.log_text.insert(tk.END, *args)
+        self.log_text.mark_set(tk.INSERT, "1.0")
+        
+        # Re-apply search highlights that fall inside the window, as one
+        # tag_add call with plain "row.col" ranges. Matches are sorted by
+        # line, so only those in the window's line span are visited
+        term_len = len(self._search_term)
+        row_of = {idx: row for row, idx in enumerate(indices, 1)}
+        ranges = []
+        lo = bisect_left(self._matches, (indices[0],))
+        hi = bisect_left(self._matches, (indices[-1] + 1,), lo)
+        for idx, col in islice(self._matches, lo, hi):
+            row = row_of.get(idx)
+            if row is not None:
+                ranges.append(f"{row}.{col}")
+                ranges.append(f"{row}.{col + term_len}")
+        if ranges:
+            self.log_text.tag_add("highlight", *ranges)
+        
+        self.scrollbar.set(first / total, min(1.0, (first + visible) / total))
+    
+    def _on_scroll(self, *args):
+        """Handle scrollbar commands by moving the virtual view"""
+        if not self._lines:
+            return
+        
+        if args[0] == tk.MOVETO:
+            self._first_line = int(float(args[1]) * self._view_length())
+            self._render_window()
+        elif args[0] == tk.SCROLL:
+            if args[2] == tk.PAGES:
+                self._scroll_pages(int(args[1]))
+            else:
+                self._scroll_lines(int(args[1]))
+    
+    def _scroll_lines(self, count: int):
+        """Scroll the virtual view by a number of lines"""
+        self._first_line = max(0, self._first_line + count)
+        self._render_window()
+        return "break"
+    
+    def _scroll_pages(self, count: int):
+        """Scroll the virtual view by a number of pages"""
+        return self._scroll_lines(count * self._visible_line_count())
+    
+    def _on_mousewheel(self, event):
+        """Handle mouse wheel scrolling (Windows/macOS)"""
+        return self._scroll_lines(-3 if event.delta > 0 else 3)
+    
+    @staticmethod
+    def _build_search_buffer(lines) -> Tuple[str, Optional[str]]:
+        """
+        Join lines into a searchable buffer.
+        
+        Returns:
+            Tuple of (text, lowercased text or None if the text is not ASCII)
+        """
+        text = ''.join(lines)
+        # Lowercasing ASCII keeps offsets intact; other text uses the regex path
+        lower = text.lower() if text.isascii() else None
+        return text, lower
+    
+    def _find_matches(self, start: int = 0):
+        """
+        Find occurrences of the current search term in the cached lines.
+        
+        Scans the joined text once (str.find for ASCII, a case-insensitive
+        regex otherwise) and maps each match offset back to (line, column)
+        by bisecting the line offset index kept up to date by _merge_lines.
+        The buffer for the whole log is cached until the lines change, so
+        repeated searches reuse it.
+        
+        Args:
+            start: First line to search; matches before it are kept
+        """
+        self._matches = [match for match in self._matches if match[0] < start]
+        if not self._search_term:
+            return
+        
+        if start == 0:
+            if self._search_cache is None:
+                self._search_cache = self._build_search_buffer(self._lines)
+            text, lower = self._search_cache
+        else:
+            text, lower = self._build_search_buffer(
+                list(islice(self._lines, start, None))
             )
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load log file:\n{e}")
-            self.status_var.set(f"Error: {e}")
+        term = self._search_term
+        
+        if lower is not None and term.isascii():
+            # C-level literal search on the lowercased buffer
+            term = term.lower()
+            positions = []
+            pos = lower.find(term)
+            while pos != -1:
+                positions.append(pos)
+                pos = lower.find(term, pos + len(term))
+        else:
+            pattern = re.compile(re.escape(term), re.IGNORECASE)
+            positions = [m.start() for m in pattern.finditer(text)]
+        
+        # Buffer offsets are relative to the start of its first line
+        line_starts = self._line_starts
+        base = line_starts[start]
+        for pos in positions:
+            pos += base
+            idx = bisect_right(line_starts, pos) - 1
+            self._matches.append((idx, pos - line_starts[idx]))
     
     def _search(self):
         """Search for text in logs"""
@@ -240,31 +726,43 @@ class LogViewerDialog(tk.Toplevel):
         if not search_term:
             return
         
-        # Remove previous highlights
-        self.log_text.tag_remove("highlight", "1.0", tk.END)
-        
-        # Search and highlight
-        start_pos = "1.0"
-        count = 0
+        self._search_term = search_term
+        self._find_matches()
+        count = len(self._matches)
         
-        while True:
-            pos = self.log_text.search(search_term, start_pos, tk.END, nocase=True)
-            if not pos:
-                break
-            
-            end_pos = f"{pos}+{len(search_term)}c"
-            self.log_text.tag_add("highlight", pos, end_pos)
-            start_pos = end_pos
-            count += 1
-        
-        if count > 0:
+        position = self._first_match_position()
+        if position is not None:
             # Scroll to first match
-            first_pos = self.log_text.search(search_term, "1.0", tk.END, nocase=True)
-            self.log_text.see(first_pos)
+            self._first_line = position
+            self._render_window()
             self.status_var.set(f"Found {count} occurrence(s)")
+        elif count > 0:
+            self._render_window()
+            self.status_var.set(
+                f"Found {count} occurrence(s), none in {self.level_var.get()} lines"
+            )
         else:
+            self._render_window()
             self.status_var.set("No matches found")
     
+    def _first_match_position(self) -> Optional[int]:
+        """
+        Get the view position of the first search match shown by the level filter.
+        
+        Returns:
+            Position in the view, or None if no shown line matches
+        """
+        rows = self._view_rows()
+        if rows is None:
+            return self._matches[0][0] if self._matches else None
+        
+        for idx, _ in self._matches:
+            number = idx + self._evicted
+            position = bisect_left(rows, number)
+            if position < len(rows) and rows[position] == number:
+                return position
+        return None
+    
     def _clear_logs(self):
         """Clear log file contents"""
         if not messagebox.askyesno(
@@ -281,6 +779,7 @@ class LogViewerDialog(tk.Toplevel):
                     f.write("")
                 
                 # Reload
+                self._reset_cache()
                 self._load_log()
                 self.status_var.set("Logs cleared")
                 logger.info("Logs cleared by user")
@@ -300,13 +799,9 @@ class LogViewerDialog(tk.Toplevel):
             return
         
         try:
-            # Copy log file
+            # Copy log file (shutil uses the OS fast-copy path where available)
             if self.log_file and self.log_file.exists():
-                with open(self.log_file, 'r', encoding='utf-8') as src:
-                    content = src.read()
-                
-                with open(filename, 'w', encoding='utf-8') as dst:
-                    dst.write(content)
+                shutil.copyfile(self.log_file, filename)
                 
                 self.status_var.set(f"Exported to: {filename}")
                 messagebox.showinfo("Export Complete", f"Logs exported to:\n{filename}")
@@ -318,6 +813,8 @@ class LogViewerDialog(tk.Toplevel):
         self.auto_refresh_enabled = self.auto_refresh_var.get()
         
         if self.auto_refresh_enabled:
+            self._last_signature = None
+            self._idle_polls = 0
             self._schedule_auto_refresh()
         else:
             if self.auto_refresh_id:
@@ -325,10 +822,32 @@ class LogViewerDialog(tk.Toplevel):
                 self.auto_refresh_id = None
     
     def _schedule_auto_refresh(self):
-        """Schedule next auto-refresh"""
-        if self.auto_refresh_enabled:
-            self._load_log()
-            self.auto_refresh_id = self.after(5000, self._schedule_auto_refresh)
+        """
+        Refresh if the log changed and schedule the next poll.
+        
+        Polls that find the file unchanged skip the reload and back off
+        (5s, 10s, 20s, capped at 30s); any change resets the interval.
+        """
+        if not self.auto_refresh_enabled:
+            return
+        
+        try:
+            st = os.stat(self.log_file)
+            signature = (st.st_mtime, st.st_size)
+        except (OSError, TypeError):
+            st = signature = None
+        
+        if signature is not None and signature == self._last_signature:
+            self._idle_polls += 1
+            delay = min(self.MAX_REFRESH_MS, self.REFRESH_MS * (1 << self._idle_polls))
+        else:
+            self._last_signature = signature
+            self._idle_polls = 0
+            delay = self.REFRESH_MS
+            # Reuse this poll's stat for the reload
+            self._load_log(st)
+        
+        self.auto_refresh_id = self.after(delay, self._schedule_auto_refresh)
     
     def destroy(self):
         """Clean up before closing"""
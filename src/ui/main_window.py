@@ -2,19 +2,70 @@
 Main window for PDF Manipulate application
 """
 
+import importlib
+import os
+import re
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
+from functools import partial
+from tkinter import ttk
 from pathlib import Path
 from typing import List, Optional
-from ..config.manager import config
 from ..config.preferences import preferences
 from ..utils.logger import logger
 from .keyboard_shortcuts import create_shortcuts_manager
 from .tooltip import create_tooltip
 
 
+# Tk window geometry: WIDTHxHEIGHT+X+Y, where X/Y may be negative on
+# multi-monitor setups (e.g. "800x600+-1280+0")
+_GEOM_RE = re.compile(r'(\d+)x(\d+)\+(-?\d+)\+(-?\d+)')
+
+# Help dialog text; placeholders are shortcut action names
+_HELP_TEMPLATE = """KEYBOARD SHORTCUTS:
+
+File Operations:
+  {open_file}  - Open PDF files
+  {quit}  - Exit application
+
+Tools:
+  {auto_rotate}  - Auto-rotate PDFs
+  {merge}  - Merge PDFs
+
+Settings & Help:
+  {settings}  - Open settings
+  {help}  - Show this help
+
+Navigation (in dialogs):
+  Arrow Keys - Navigate items
+  Enter - Accept/Select
+  Escape - Cancel/Close
+
+FEATURES:
+
+Auto-Rotation:
+  Automatically detect and rotate incorrectly oriented pages using OCR.
+  Review and manually adjust rotations before applying.
+
+PDF Merging:
+  Select multiple PDFs and merge them in any order.
+  Preview pages before merging.
+  Use smart naming templates for output files.
+
+Smart Naming:
+  Use templates like {{date}}_{{name}}.pdf
+  Date arithmetic: {{date+7}} for 7 days from now
+  Variables: {{date}}, {{name}}, {{filename}}, {{timestamp}}, {{counter}}
+
+For more information, see the documentation or visit:
+https://github.com/McJono/pdf-manipulate
+"""
+
+
 class MainWindow:
     """Main application window"""
+    
+    # Delay before writing changed preferences, so bursts coalesce
+    SAVE_DELAY_MS = 500
 
     def __init__(self):
         """Initialize main window"""
@@ -33,10 +84,38 @@ class MainWindow:
 
         # Selected files
         self.selected_files: List[Path] = []
+        
+        # Fallback start directory for file dialogs
+        self._home_dir = str(Path.home())
+        
+        # Recent Files submenu is rebuilt when next opened after a change
+        self._recent_dirty = True
+        
+        # Pending debounced preferences save
+        self._save_id: Optional[str] = None
+        
+        # Help and About windows are built on first use, then hidden and
+        # re-shown rather than destroyed
+        self._help_window: Optional[tk.Toplevel] = None
+        self._about_window: Optional[tk.Toplevel] = None
 
         # Setup keyboard shortcuts
         self.shortcuts = create_shortcuts_manager(self.root)
         self._setup_shortcuts()
+        
+        # Shortcut display text, resolved once for menus, tooltips and help
+        self._shortcut_text = {
+            action: self.shortcuts.get_display_text(action)
+            for action in ('open_file', 'quit', 'settings', 'auto_rotate', 'merge', 'help')
+        }
+        self._help_content = _HELP_TEMPLATE.format(**self._shortcut_text)
+        self._tooltip_text = {
+            'open': f"Open PDF files ({self._shortcut_text['open_file']})",
+            'rotate': f"Auto-rotate PDFs ({self._shortcut_text['auto_rotate']})",
+            'merge': f"Merge PDFs ({self._shortcut_text['merge']})",
+            'settings': f"Settings ({self._shortcut_text['settings']})",
+            'help': f"Help ({self._shortcut_text['help']})",
+        }
 
         # Setup UI
         self._create_menu()
@@ -48,6 +127,9 @@ class MainWindow:
         
         # Show getting started wizard on first run
         self.root.after(500, self._show_getting_started_if_needed)
+        
+        # Import the heavier screens once the window is up
+        self.root.after_idle(self._preload_modules)
 
         logger.info("Main window initialized")
 
@@ -61,8 +143,8 @@ class MainWindow:
         menubar.add_cascade(label="File", menu=file_menu)
         
         # Add keyboard shortcut hints to menu items
-        open_shortcut = self.shortcuts.get_display_text('open_file')
-        quit_shortcut = self.shortcuts.get_display_text('quit')
+        open_shortcut = self._shortcut_text['open_file']
+        quit_shortcut = self._shortcut_text['quit']
         
         file_menu.add_command(
             label=f"Open PDF{'...':<15}{open_shortcut:>10}",
@@ -70,10 +152,15 @@ class MainWindow:
         )
         file_menu.add_command(label="Open Folder...", command=self._open_folder)
         
-        # Recent files submenu
-        self.recent_files_menu = tk.Menu(file_menu, tearoff=0)
+        # Recent files submenu (populated when it is opened)
+        self.recent_files_menu = tk.Menu(
+            file_menu,
+            tearoff=0,
+            postcommand=self._update_recent_files_menu
+        )
         file_menu.add_cascade(label="Recent Files", menu=self.recent_files_menu)
-        self._update_recent_files_menu()
+        # Placeholder until the postcommand first fills the submenu
+        self.recent_files_menu.add_command(label="(No recent files)", state=tk.DISABLED)
         
         file_menu.add_separator()
         file_menu.add_command(
@@ -85,7 +172,7 @@ class MainWindow:
         edit_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Edit", menu=edit_menu)
         
-        settings_shortcut = self.shortcuts.get_display_text('settings')
+        settings_shortcut = self._shortcut_text['settings']
         edit_menu.add_command(
             label=f"Settings...{'':< 15}{settings_shortcut:>10}",
             command=self._show_settings
@@ -95,8 +182,8 @@ class MainWindow:
         tools_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Tools", menu=tools_menu)
         
-        auto_rotate_shortcut = self.shortcuts.get_display_text('auto_rotate')
-        merge_shortcut = self.shortcuts.get_display_text('merge')
+        auto_rotate_shortcut = self._shortcut_text['auto_rotate']
+        merge_shortcut = self._shortcut_text['merge']
         
         tools_menu.add_command(
             label=f"Auto-Rotate{'':< 15}{auto_rotate_shortcut:>10}",
@@ -112,7 +199,7 @@ class MainWindow:
         help_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Help", menu=help_menu)
         
-        help_shortcut = self.shortcuts.get_display_text('help')
+        help_shortcut = self._shortcut_text['help']
         help_menu.add_command(
             label=f"Help{'':< 15}{help_shortcut:>10}",
             command=self._show_help
@@ -130,7 +217,7 @@ class MainWindow:
         # Open file button
         btn_open = ttk.Button(toolbar, text="📁 Open", command=self._open_file, width=12)
         btn_open.pack(side=tk.LEFT, padx=2, pady=2)
-        create_tooltip(btn_open, f"Open PDF files ({self.shortcuts.get_display_text('open_file')})")
+        create_tooltip(btn_open, self._tooltip_text['open'])
         
         # Separator
         ttk.Separator(toolbar, orient=tk.VERTICAL).pack(side=tk.LEFT, fill=tk.Y, padx=5, pady=2)
@@ -138,12 +225,12 @@ class MainWindow:
         # Auto-rotate button
         btn_rotate = ttk.Button(toolbar, text="🔄 Auto-Rotate", command=self._show_auto_rotate, width=14)
         btn_rotate.pack(side=tk.LEFT, padx=2, pady=2)
-        create_tooltip(btn_rotate, f"Auto-rotate PDFs ({self.shortcuts.get_display_text('auto_rotate')})")
+        create_tooltip(btn_rotate, self._tooltip_text['rotate'])
         
         # Merge button
         btn_merge = ttk.Button(toolbar, text="🔗 Merge", command=self._show_merge, width=12)
         btn_merge.pack(side=tk.LEFT, padx=2, pady=2)
-        create_tooltip(btn_merge, f"Merge PDFs ({self.shortcuts.get_display_text('merge')})")
+        create_tooltip(btn_merge, self._tooltip_text['merge'])
         
         # Separator
         ttk.Separator(toolbar, orient=tk.VERTICAL).pack(side=tk.LEFT, fill=tk.Y, padx=5, pady=2)
@@ -151,12 +238,18 @@ class MainWindow:
         # Settings button
         btn_settings = ttk.Button(toolbar, text="⚙️ Settings", command=self._show_settings, width=12)
         btn_settings.pack(side=tk.LEFT, padx=2, pady=2)
-        create_tooltip(btn_settings, f"Settings ({self.shortcuts.get_display_text('settings')})")
+        create_tooltip(btn_settings, self._tooltip_text['settings'])
         
         # Help button (on the right)
         btn_help = ttk.Button(toolbar, text="❓ Help", command=self._show_help, width=10)
         btn_help.pack(side=tk.RIGHT, padx=2, pady=2)
-        create_tooltip(btn_help, f"Help ({self.shortcuts.get_display_text('help')})")
+        create_tooltip(btn_help, self._tooltip_text['help'])
+        
+        # Fix the toolbar at its natural size so resizing the main window
+        # doesn't re-run pack over its children
+        toolbar.update_idletasks()
+        toolbar.configure(width=toolbar.winfo_reqwidth(), height=toolbar.winfo_reqheight())
+        toolbar.pack_propagate(False)
     
     def _setup_shortcuts(self) -> None:
         """Setup keyboard shortcuts"""
@@ -168,7 +261,11 @@ class MainWindow:
         self.shortcuts.bind('help', self._show_help)
     
     def _update_recent_files_menu(self) -> None:
-        """Update the recent files menu"""
+        """Update the recent files menu if the list changed since it was built"""
+        if not self._recent_dirty:
+            return
+        self._recent_dirty = False
+        
         # Clear existing items
         self.recent_files_menu.delete(0, tk.END)
         
@@ -181,7 +278,7 @@ class MainWindow:
                 path = Path(filepath)
                 self.recent_files_menu.add_command(
                     label=path.name,
-                    command=lambda p=path: self._open_recent_file(p)
+                    command=partial(self._open_recent_file, path)
                 )
             
             # Add clear recent files option
@@ -193,6 +290,8 @@ class MainWindow:
     
     def _open_recent_file(self, filepath: Path) -> None:
         """Open a recent file"""
+        from tkinter import messagebox
+        
         if filepath.exists():
             self.selected_files = [filepath]
             self.status_var.set(f"Opened: {filepath.name}")
@@ -200,32 +299,45 @@ class MainWindow:
         else:
             messagebox.showerror("File Not Found", f"File not found:\n{filepath}")
             # Remove from recent files
+            missing = str(filepath)
             recent = preferences.get("recent_files", [])
-            if str(filepath) in recent:
-                recent.remove(str(filepath))
-                preferences.set("recent_files", recent)
-                preferences.save()
-                self._update_recent_files_menu()
+            kept = [entry for entry in recent if entry != missing]
+            if len(kept) != len(recent):
+                preferences.set("recent_files", kept)
+                self._schedule_save()
+                self._recent_dirty = True
     
     def _clear_recent_files(self) -> None:
         """Clear recent files list"""
+        from tkinter import messagebox
+        
         if messagebox.askyesno("Clear Recent Files", "Clear all recent files from the list?"):
             preferences.set("recent_files", [])
-            preferences.save()
-            self._update_recent_files_menu()
+            self._schedule_save()
+            self._recent_dirty = True
+    
+    def _schedule_save(self) -> None:
+        """Save preferences shortly, once for any changes made until then"""
+        if self._save_id is None:
+            self._save_id = self.root.after(self.SAVE_DELAY_MS, self._flush_preferences)
+    
+    def _flush_preferences(self) -> None:
+        """Save preferences now, cancelling any pending save"""
+        if self._save_id is not None:
+            self.root.after_cancel(self._save_id)
+            self._save_id = None
+        preferences.save()
     
     def _on_closing(self, event=None) -> None:
         """Handle window closing - save preferences"""
         # Save window geometry
-        geom = self.root.geometry()
-        # Parse geometry string: WIDTHxHEIGHT+X+Y
-        parts = geom.replace('x', '+').split('+')
-        if len(parts) >= 4:
-            width, height, x, y = int(parts[0]), int(parts[1]), int(parts[2]), int(parts[3])
+        match = _GEOM_RE.match(self.root.geometry())
+        if match:
+            width, height, x, y = map(int, match.groups())
             preferences.set_window_geometry(width, height, x, y)
         
         # Save preferences
-        preferences.save()
+        self._flush_preferences()
         logger.info("Saved preferences")
         
         # Close application
@@ -290,10 +402,13 @@ class MainWindow:
 
     def _open_file(self, event=None) -> None:
         """Open file dialog to select PDF files"""
+        from tkinter import filedialog
+        
         # Get initial directory from preferences
-        initial_dir = preferences.get("last_output_directory", str(Path.home()))
+        initial_dir = preferences.get("last_output_directory", self._home_dir)
         
         files = filedialog.askopenfilenames(
+            parent=self.root,
             title="Select PDF files",
             filetypes=[("PDF files", "*.pdf"), ("All files", "*.*")],
             initialdir=initial_dir
@@ -305,34 +420,54 @@ class MainWindow:
             logger.info(f"Selected {len(self.selected_files)} files")
             
             # Add to recent files
-            for file in self.selected_files:
-                preferences.add_recent_file(file)
+            preferences.add_recent_files(self.selected_files)
+            self._recent_dirty = True
             
             # Save directory
-            if self.selected_files:
-                preferences.set("last_output_directory", str(self.selected_files[0].parent))
-                preferences.save()
-                self._update_recent_files_menu()
+            preferences.set("last_output_directory", str(self.selected_files[0].parent))
+            self._schedule_save()
 
     def _open_folder(self) -> None:
         """Open folder dialog"""
+        from tkinter import filedialog
+        
         # Get initial directory from preferences
-        initial_dir = preferences.get("last_output_directory", str(Path.home()))
+        initial_dir = preferences.get("last_output_directory", self._home_dir)
         
-        folder = filedialog.askdirectory(title="Select folder", initialdir=initial_dir)
+        folder = filedialog.askdirectory(
+            parent=self.root,
+            title="Select folder",
+            initialdir=initial_dir
+        )
         if folder:
             folder_path = Path(folder)
-            self.selected_files = list(folder_path.glob("*.pdf"))
+            # scandir's entries carry their type, so no stat per file
+            with os.scandir(folder_path) as entries:
+                self.selected_files = [
+                    Path(entry.path) for entry in entries
+                    if entry.name.lower().endswith('.pdf') and entry.is_file()
+                ]
             self.status_var.set(f"Found {len(self.selected_files)} PDF(s) in folder")
             logger.info(f"Found {len(self.selected_files)} PDFs in {folder}")
             
             # Add to recent directories
             preferences.add_recent_directory(folder_path)
             preferences.set("last_output_directory", str(folder_path))
-            preferences.save()
+            self._schedule_save()
 
+    def _preload_modules(self) -> None:
+        """Import screen modules ahead of first use so opening them doesn't stall"""
+        try:
+            for module in ("merge_screen", "settings_dialog"):
+                importlib.import_module(f".{module}", __package__)
+        except Exception as e:
+            # Reported when the screen is actually opened
+            logger.debug(f"Could not preload screens: {e}")
+    
     def _show_auto_rotate(self) -> None:
         """Show auto-rotation interface (placeholder)"""
+        from tkinter import messagebox
+        
         messagebox.showinfo(
             "Auto-Rotate",
             "Auto-rotation feature coming soon!\n\n"
@@ -341,6 +476,8 @@ class MainWindow:
 
     def _show_merge(self) -> None:
         """Show merge interface"""
+        from tkinter import messagebox
+        
         try:
             from .merge_screen import show_merge_screen
             
@@ -364,6 +501,8 @@ class MainWindow:
 
     def _show_batch_process(self) -> None:
         """Show batch processing interface (placeholder)"""
+        from tkinter import messagebox
+        
         messagebox.showinfo(
             "Batch Process",
             "Batch processing feature coming soon!"
@@ -371,6 +510,8 @@ class MainWindow:
     
     def _show_settings(self) -> None:
         """Show settings/preferences dialog"""
+        from tkinter import messagebox
+        
         try:
             from .settings_dialog import show_settings_dialog
             show_settings_dialog(self.root)
@@ -380,10 +521,18 @@ class MainWindow:
     
     def _show_help(self, event=None) -> None:
         """Show help dialog"""
-        help_window = tk.Toplevel(self.root)
+        if self._help_window is not None and self._help_window.winfo_exists():
+            self._help_window.deiconify()
+            self._help_window.lift()
+            return
+        
+        # Built while withdrawn and mapped once complete, so it is drawn once
+        help_window = self._help_window = tk.Toplevel(self.root)
+        help_window.withdraw()
         help_window.title("PDF Manipulate - Help")
         help_window.geometry("600x500")
         help_window.transient(self.root)
+        help_window.protocol("WM_DELETE_WINDOW", help_window.withdraw)
         
         # Main frame
         main_frame = ttk.Frame(help_window, padding=20)
@@ -405,65 +554,24 @@ class MainWindow:
         )
         help_text.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
         
-        help_content = """KEYBOARD SHORTCUTS:
-
-File Operations:
-  {open}  - Open PDF files
-  {quit}  - Exit application
-
-Tools:
-  {auto_rotate}  - Auto-rotate PDFs
-  {merge}  - Merge PDFs
-
-Settings & Help:
-  {settings}  - Open settings
-  {help}  - Show this help
-
-Navigation (in dialogs):
-  Arrow Keys - Navigate items
-  Enter - Accept/Select
-  Escape - Cancel/Close
-
-FEATURES:
-
-Auto-Rotation:
-  Automatically detect and rotate incorrectly oriented pages using OCR.
-  Review and manually adjust rotations before applying.
-
-PDF Merging:
-  Select multiple PDFs and merge them in any order.
-  Preview pages before merging.
-  Use smart naming templates for output files.
-
-Smart Naming:
-  Use templates like {{date}}_{{name}}.pdf
-  Date arithmetic: {{date+7}} for 7 days from now
-  Variables: {{date}}, {{name}}, {{filename}}, {{timestamp}}, {{counter}}
-
-For more information, see the documentation or visit:
-https://github.com/McJono/pdf-manipulate
-""".format(
-            open=self.shortcuts.get_display_text('open_file'),
-            quit=self.shortcuts.get_display_text('quit'),
-            auto_rotate=self.shortcuts.get_display_text('auto_rotate'),
-            merge=self.shortcuts.get_display_text('merge'),
-            settings=self.shortcuts.get_display_text('settings'),
-            help=self.shortcuts.get_display_text('help')
-        )
-        
-        help_text.insert("1.0", help_content)
+        help_text.insert("1.0", self._help_content)
         help_text.config(state=tk.DISABLED)
         
         # Close button
         ttk.Button(
             main_frame,
             text="Close",
-            command=help_window.destroy,
+            command=help_window.withdraw,
             width=15
         ).pack()
+        
+        help_window.update_idletasks()
+        help_window.deiconify()
     
     def _show_logs(self) -> None:
         """Show log viewer dialog"""
+        from tkinter import messagebox
+        
         try:
             from .log_viewer import show_log_viewer
             show_log_viewer(self.root)
@@ -473,6 +581,8 @@ https://github.com/McJono/pdf-manipulate
     
     def _show_getting_started(self) -> None:
         """Show getting started wizard"""
+        from tkinter import messagebox
+        
         try:
             from .getting_started import GettingStartedWizard
             GettingStartedWizard(self.root)
@@ -490,7 +600,15 @@ https://github.com/McJono/pdf-manipulate
 
     def _show_about(self) -> None:
         """Show about dialog"""
-        about_window = tk.Toplevel(self.root)
+        from tkinter import messagebox
+        
+        if self._about_window is not None and self._about_window.winfo_exists():
+            self._about_window.deiconify()
+            self._about_window.lift()
+            self._about_window.grab_set()
+            return
+        
+        about_window = self._about_window = tk.Toplevel(self.root)
         about_window.title("About PDF Manipulate")
         about_window.geometry("450x400")
         about_window.resizable(False, False)
@@ -498,6 +616,7 @@ https://github.com/McJono/pdf-manipulate
         # Center the window
         about_window.transient(self.root)
         about_window.grab_set()
+        about_window.protocol("WM_DELETE_WINDOW", self._hide_about)
         
         # Main frame
         main_frame = ttk.Frame(about_window, padding=20)
@@ -520,16 +639,6 @@ https://github.com/McJono/pdf-manipulate
         version.pack(pady=(0, 20))
         
         # Description
-        description = tk.Text(
-            main_frame,
-            height=8,
-            width=50,
-            wrap=tk.WORD,
-            relief=tk.FLAT,
-            background=about_window.cget('bg')
-        )
-        description.pack(pady=(0, 20))
-        
         description_text = """An intelligent PDF manipulation program that automates document processing with features for auto-rotation, merging, and smart file naming.
 
 Features:
@@ -538,8 +647,13 @@ Features:
 • Smart Naming - Template-based file naming with date arithmetic
 • Cross-Platform - Works on Windows, macOS, and Linux"""
         
-        description.insert("1.0", description_text)
-        description.config(state=tk.DISABLED)
+        description = ttk.Label(
+            main_frame,
+            text=description_text,
+            wraplength=410,
+            justify=tk.LEFT
+        )
+        description.pack(pady=(0, 20))
         
         # Copyright
         copyright_label = ttk.Label(
@@ -580,9 +694,14 @@ Features:
         ttk.Button(
             main_frame,
             text="Close",
-            command=about_window.destroy,
+            command=self._hide_about,
             width=15
         ).pack()
+    
+    def _hide_about(self) -> None:
+        """Hide the about dialog, keeping it for the next time it is shown"""
+        self._about_window.grab_release()
+        self._about_window.withdraw()
 
     def run(self) -> None:
         """Start the application main loop"""
@@ -9,9 +9,15 @@ import os
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
-from typing import List, Optional, Dict, Tuple
+from typing import Deque, List, Optional, Dict, Tuple
 import logging
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from PIL import Image, ImageTk
 
 try:
@@ -25,6 +31,8 @@ except ImportError:
 from .naming_dialog import show_naming_dialog
 from .tooltip import create_tooltip
 from ..config.manager import config
+from ..pdf_operations.page_count_cache import page_count_cache
+from ..utils.background import io_pool, merge_pool, priority_pool
 from ..utils.validators import ensure_extension
 
 logger = logging.getLogger(__name__)
@@ -33,40 +41,112 @@ logger = logging.getLogger(__name__)
 class PDFFileInfo:
     """Information about a PDF file for the merge interface."""
     
-    def __init__(self, file_path: str):
+    # Size units, each 1024 (2**10) times the previous
+    SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+    
+    def __init__(
+        self,
+        file_path: str,
+        load_page_count: bool = True,
+        stat_result: Optional[os.stat_result] = None
+    ):
         """
         Initialize file info.
         
         Args:
             file_path: Path to the PDF file
+            load_page_count: Whether to open the PDF now for its page count
+                if it isn't cached. If False, page_count stays None until it
+                is set by the caller (e.g. from read_page_count run in the
+                background)
+            stat_result: The file's stat if already known (e.g. from
+                os.scandir), saving another stat call
         """
         self.file_path = file_path
         self.filename = os.path.basename(file_path)
-        self.file_size = os.path.getsize(file_path)
-        self.modified_date = datetime.fromtimestamp(os.path.getmtime(file_path))
-        self.page_count = 0
+        st = stat_result if stat_result is not None else os.stat(file_path)
+        self.file_size = st.st_size
+        self.modified_date = datetime.fromtimestamp(st.st_mtime)
+        self.mtime_ns = st.st_mtime_ns
         self.thumbnail: Optional[ImageTk.PhotoImage] = None
+        # Modification time of the file when the thumbnail was rendered
+        self.thumbnail_mtime_ns: Optional[int] = None
+        
+        # Display strings, formatted on first use
+        self._size_text: Optional[str] = None
+        self._date_text: Optional[str] = None
+        self._row_values: Optional[Tuple[str, str, str]] = None
+        
+        self.page_count: Optional[int] = page_count_cache.get(
+            file_path, self.mtime_ns, self.file_size
+        )
+        
+        if self.page_count is None and load_page_count:
+            self.page_count = self.read_page_count()
+    
+    def read_page_count(self) -> int:
+        """
+        Open the PDF to count its pages, and cache the count.
         
-        # Try to get page count
+        Returns:
+            Number of pages, or 0 if the file could not be read
+        """
         try:
             if DEPENDENCIES_AVAILABLE:
-                doc = load_pdf(file_path)
-                self.page_count = doc.page_count
+                page_count = load_pdf(self.file_path).page_count
+                page_count_cache.put(self.file_path, self.mtime_ns, self.file_size, page_count)
+                return page_count
         except Exception as e:
-            logger.warning(f"Could not load page count for {file_path}: {type(e).__name__}: {e}")
+            logger.warning(
+                f"Could not load page count for {self.file_path}: {type(e).__name__}: {e}"
+            )
+        return 0
+    
+    def format_pages(self) -> str:
+        """Format page count, or a placeholder while it is being read."""
+        return "…" if self.page_count is None else str(self.page_count)
     
     def format_size(self) -> str:
         """Format file size in human-readable form."""
-        size = self.file_size
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024.0:
-                return f"{size:.1f} {unit}"
-            size /= 1024.0
-        return f"{size:.1f} TB"
+        if self._size_text is None:
+            size = self.file_size
+            # Largest unit not above the size: one per 10 bits past the first
+            unit = min((size.bit_length() - 1) // 10, len(self.SIZE_UNITS) - 1) if size else 0
+            self._size_text = f"{size / (1 << (10 * unit)):.1f} {self.SIZE_UNITS[unit]}"
+        return self._size_text
     
     def format_date(self) -> str:
         """Format modification date."""
-        return self.modified_date.strftime("%Y-%m-%d %H:%M")
+        if self._date_text is None:
+            self._date_text = self.modified_date.strftime("%Y-%m-%d %H:%M")
+        return self._date_text
+    
+    def current_thumbnail(self) -> Optional[ImageTk.PhotoImage]:
+        """
+        Get the thumbnail if the file hasn't changed since it was rendered.
+        
+        Returns:
+            Thumbnail photo, or None if there is none or it is out of date
+        """
+        if self.thumbnail is None:
+            return None
+        try:
+            mtime_ns = os.stat(self.file_path).st_mtime_ns
+        except OSError:
+            return None
+        return self.thumbnail if mtime_ns == self.thumbnail_mtime_ns else None
+    
+    def row_values(self) -> Tuple[str, str, str]:
+        """
+        Get the values of the file's row in the file list.
+        
+        Returns:
+            Formatted (size, pages, date), reused until the page count changes
+        """
+        pages = self.format_pages()
+        if self._row_values is None or self._row_values[1] != pages:
+            self._row_values = (self.format_size(), pages, self.format_date())
+        return self._row_values
 
 
 class PreviewDialog(tk.Toplevel):
@@ -77,7 +157,22 @@ class PreviewDialog(tk.Toplevel):
     MAX_ZOOM_LEVEL = 3.0   # 300%
     ZOOM_STEP = 1.25       # 25% increment
     
-    def __init__(self, parent, pdf_path: str, page_number: int = 0):
+    # Page renders per second at most while paging quickly (e.g. a held key)
+    MAX_RENDER_RATE = 10
+    
+    # Zoom clicks within this many ms render only the final zoom level
+    ZOOM_RENDER_DELAY_MS = 150
+    
+    # Number of rendered page photos kept for revisits
+    PAGE_PHOTOS_KEPT = 8
+    
+    def __init__(
+        self,
+        parent,
+        pdf_path: str,
+        page_number: int = 0,
+        total_pages: Optional[int] = None
+    ):
         """
         Initialize preview dialog.
         
@@ -85,6 +180,8 @@ class PreviewDialog(tk.Toplevel):
             parent: Parent window
             pdf_path: Path to PDF file
             page_number: Initial page to display (0-indexed)
+            total_pages: Number of pages if already known; otherwise the
+                PDF is opened to count them
         """
         super().__init__(parent)
         
@@ -94,14 +191,24 @@ class PreviewDialog(tk.Toplevel):
         self.preview_generator = PDFPreviewGenerator()
         self.zoom_level = 1.0  # 1.0 = 100%, 0.5 = 50%, 2.0 = 200%
         self.zoom_dpi = 150  # Base DPI for rendering
+        self._render_id: Optional[str] = None
+        self._last_render_ts = 0.0
+        
+        # Renders of the pages either side of the shown one into the cache
+        self._prefetch_jobs: List[Future] = []
+        # (page, dpi, mtime_ns) -> page photo, oldest first
+        self._page_photos: Dict[Tuple[int, int, int], ImageTk.PhotoImage] = {}
         
         # Get total pages
-        try:
-            doc = load_pdf(pdf_path)
-            self.total_pages = doc.page_count
-        except Exception as e:
-            logger.error(f"Could not load PDF metadata: {e}")
-            self.total_pages = 1
+        if total_pages:
+            self.total_pages = total_pages
+        else:
+            try:
+                doc = load_pdf(pdf_path)
+                self.total_pages = doc.page_count
+            except Exception as e:
+                logger.error(f"Could not load PDF metadata: {e}")
+                self.total_pages = 1
         
         self.title(f"Preview: {os.path.basename(pdf_path)}")
         self.geometry("800x900")
@@ -191,37 +298,50 @@ class PreviewDialog(tk.Toplevel):
         close_button = ttk.Button(self, text="Close", command=self.destroy)
         close_button.pack(pady=5)
     
-    def _load_page(self):
-        """Load and display the current page."""
-        # Update page label
+    def _update_page_controls(self):
+        """Update the page label and navigation buttons for the current page."""
         self.page_label.config(
             text=f"Page {self.current_page + 1} of {self.total_pages}"
         )
         
-        # Update button states
         self.prev_button.config(state=tk.NORMAL if self.current_page > 0 else tk.DISABLED)
         self.next_button.config(
             state=tk.NORMAL if self.current_page < self.total_pages - 1 else tk.DISABLED
         )
+    
+    def _schedule_load_page(self):
+        """
+        Show the new page number now and render the page soon.
+        
+        Renders are spaced at least 1/MAX_RENDER_RATE seconds apart. Page
+        changes while a render is pending just move it to the latest page,
+        so paging faster than pages render never queues up renders.
+        """
+        self._update_page_controls()
+        if self._render_id is not None:
+            return
+        wait = 1 / self.MAX_RENDER_RATE - (time.monotonic() - self._last_render_ts)
+        self._render_id = self.after(max(int(wait * 1000), 0), self._load_page)
+    
+    def _load_page(self):
+        """Load and display the current page."""
+        if self._render_id is not None:
+            # Called directly while a render was scheduled
+            self.after_cancel(self._render_id)
+            self._render_id = None
+        self._update_page_controls()
         
         # Load preview image with zoom applied
         try:
             # Calculate DPI based on zoom level
             dpi = int(self.zoom_dpi * self.zoom_level)
             
-            image = self.preview_generator.generate_preview(
-                self.pdf_path,
-                self.current_page,
-                dpi=dpi
-            )
+            photo = self._get_page_photo(self.current_page, dpi)
             
-            if image:
-                # Convert to PhotoImage
-                photo = ImageTk.PhotoImage(image)
-                
-                # Clear canvas
-                self.canvas.delete("all")
-                
+            self.canvas.delete("all")
+            self.canvas.image = None
+            
+            if photo is not None:
                 # Center image on canvas
                 canvas_width = self.canvas.winfo_width()
                 x = max((canvas_width - photo.width()) // 2, 0)
@@ -232,8 +352,9 @@ class PreviewDialog(tk.Toplevel):
                 
                 # Configure scroll region
                 self.canvas.config(scrollregion=(0, 0, photo.width(), photo.height()))
+                
+                self._prefetch_neighbours(dpi)
             else:
-                self.canvas.delete("all")
                 self.canvas.create_text(
                     400, 300,
                     text="Preview not available",
@@ -242,18 +363,74 @@ class PreviewDialog(tk.Toplevel):
         except Exception as e:
             logger.error(f"Error loading preview: {e}")
             messagebox.showerror("Error", f"Failed to load preview:\n{str(e)}")
+        
+        self._last_render_ts = time.monotonic()
+    
+    def _get_page_photo(self, page: int, dpi: int) -> Optional[ImageTk.PhotoImage]:
+        """
+        Get the photo of a page, reusing one made for an earlier visit.
+        
+        Photos of the last PAGE_PHOTOS_KEPT pages shown are kept, so going
+        back to a page skips both the render and the copy into Tk.
+        
+        Args:
+            page: Page number (0-indexed)
+            dpi: Resolution to render at
+        
+        Returns:
+            Page photo, or None if the page couldn't be rendered
+        """
+        try:
+            key = (page, dpi, os.stat(self.pdf_path).st_mtime_ns)
+        except OSError:
+            key = None
+        
+        # Re-insert so a reused photo moves to the newest end
+        photo = self._page_photos.pop(key, None)
+        if photo is None:
+            image = self.preview_generator.generate_preview(self.pdf_path, page, dpi=dpi)
+            if not image:
+                return None
+            photo = ImageTk.PhotoImage(image)
+        
+        if key is not None:
+            self._page_photos[key] = photo
+            while len(self._page_photos) > self.PAGE_PHOTOS_KEPT:
+                del self._page_photos[next(iter(self._page_photos))]
+        return photo
+    
+    def _prefetch_neighbours(self, dpi: int):
+        """
+        Render the next and previous pages in the background.
+        
+        The images land in the preview generator's cache, so stepping to
+        either page doesn't wait for a render. Prefetches for pages left
+        behind that haven't started yet are cancelled.
+        
+        Args:
+            dpi: Resolution the current page was rendered at
+        """
+        for job in self._prefetch_jobs:
+            job.cancel()
+        self._prefetch_jobs = [
+            io_pool.submit(
+                self.preview_generator.generate_preview, self.pdf_path, page, dpi=dpi
+            )
+            for page in (self.current_page + 1, self.current_page - 1)
+            if 0 <= page < self.total_pages
+        ]
     
     def _previous_page(self):
         """Navigate to previous page."""
         if self.current_page > 0:
             self.current_page -= 1
-            self._load_page()
+            self._schedule_load_page()
     
     def _next_page(self):
         """Navigate to next page."""
         if self.current_page < self.total_pages - 1:
             self.current_page += 1
-            self._load_page()
+            self._schedule_load_page()
     
     def _zoom_in(self):
         """Zoom in (increase size by 25%)."""
@@ -273,14 +450,43 @@ class PreviewDialog(tk.Toplevel):
         self._update_zoom()
     
     def _update_zoom(self):
-        """Update zoom label and reload page."""
+        """
+        Update zoom label now and reload page once zooming pauses.
+        
+        Each zoom change restarts the ZOOM_RENDER_DELAY_MS wait, since
+        renders at intermediate zoom levels would be thrown away.
+        """
         self.zoom_label.config(text=f"{int(self.zoom_level * 100)}%")
-        self._load_page()
+        if self._render_id is not None:
+            self.after_cancel(self._render_id)
+        self._render_id = self.after(self.ZOOM_RENDER_DELAY_MS, self._load_page)
+    
+    def destroy(self):
+        """Cancel pending page renders and prefetches before closing."""
+        if self._render_id is not None:
+            self.after_cancel(self._render_id)
+            self._render_id = None
+        for job in self._prefetch_jobs:
+            job.cancel()
+        self._page_photos.clear()
+        super().destroy()
 
 
 class MergeScreen(ttk.Frame):
     """Main merge screen with file selection and preview."""
     
+    # Page counts finished within this many ms are shown in one batch
+    PAGE_COUNT_FLUSH_MS = 50
+    
+    # Selection changes within this many ms render only the last preview
+    PREVIEW_DELAY_MS = 120
+    
+    # Number of files whose thumbnail photo is kept for revisits
+    THUMBNAILS_KEPT = 50
+    
+    # File list rows inserted per Tk callback when listing many files
+    FILE_ROWS_PER_BATCH = 200
+    
     def __init__(self, parent):
         """
         Initialize merge screen.
@@ -298,6 +504,35 @@ class MergeScreen(ttk.Frame):
         self.files: Dict[str, PDFFileInfo] = {}  # file_path -> info
         self.merge_queue: List[str] = []  # Ordered list of file paths
         
+        # Rows currently in the file tree: file_path -> info shown, and
+        # their (filename, file_path) sort keys in display order
+        self._displayed: Dict[str, PDFFileInfo] = {}
+        self._displayed_order: List[Tuple[str, str]] = []
+        # Files added since the last refresh, and whether any were removed
+        self._unlisted: List[str] = []
+        self._files_removed = False
+        self._refresh_after_id: Optional[str] = None
+        
+        # Page counts are read on the shared pool; file_path -> pending job.
+        # The selected file's count skips the queue on the priority pool
+        self._page_count_jobs: Dict[str, Future] = {}
+        # Finished (file_path, job, page_count) waiting for the Tk main loop
+        self._page_count_results: List[Tuple[str, Future, int]] = []
+        self._page_count_lock = threading.Lock()
+        
+        # Pending thumbnail render of the selected file, and a file whose
+        # render waits for the preview to be visible again
+        self._preview_after_id: Optional[str] = None
+        self._hidden_preview: Optional[str] = None
+        # Files holding a thumbnail photo, oldest first
+        self._thumbnail_infos: Deque[PDFFileInfo] = deque()
+        
+        # Whether a merge is running in the background
+        self._merging = False
+        # Merge history log kept open for appending, and its path
+        self._merge_log = None
+        self._merge_log_path: Optional[str] = None
+        
         self._create_widgets()
     
     def _show_dependency_error(self):
@@ -395,7 +630,7 @@ class MergeScreen(ttk.Frame):
         
         # Bind events
         self.file_tree.bind('<Double-Button-1>', self._on_file_double_click)
-        self.file_tree.bind('<Button-1>', self._on_file_click)
+        self.file_tree.bind('<<TreeviewSelect>>', self._on_file_select)
         
         return frame
     
@@ -474,6 +709,9 @@ class MergeScreen(ttk.Frame):
             "Merge all files in the queue into a single PDF\n(Select at least 2 files to enable)"
         )
         
+        # Shown while a merge runs; one step per source file plus the write
+        self.merge_progress = ttk.Progressbar(button_frame, mode='determinate')
+        
         return frame
     
     def _create_preview_panel(self) -> ttk.Frame:
@@ -493,6 +731,10 @@ class MergeScreen(ttk.Frame):
         )
         self.preview_canvas.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
+        # Map events of the window and all its children (e.g. a notebook
+        # tab being shown) reach the toplevel's binding
+        self.winfo_toplevel().bind('<Map>', self._on_map, add='+')
+        
         # Info label
         self.preview_info_label = ttk.Label(
             frame,
@@ -520,13 +762,17 @@ class MergeScreen(ttk.Frame):
     
     def _open_folder(self):
         """Open a folder and load all PDFs."""
-        folder = filedialog.askdirectory(title="Select Folder Containing PDFs")
+        folder = filedialog.askdirectory(
+            parent=self.winfo_toplevel(),
+            title="Select Folder Containing PDFs"
+        )
         if folder:
             self._load_folder(folder)
     
     def _add_files(self):
         """Add individual PDF files."""
         files = filedialog.askopenfilenames(
+            parent=self.winfo_toplevel(),
             title="Select PDF Files",
             filetypes=[("PDF files", "*.pdf"), ("All files", "*.*")]
         )
@@ -538,51 +784,203 @@ class MergeScreen(ttk.Frame):
         """
         Load all PDFs from a folder.
         
+        Files already listed that haven't changed (same modification time
+        and size) keep their PDFFileInfo, with its page count and
+        thumbnail, and their row is left as it is.
+        
         Args:
             folder_path: Path to folder
         """
-        self.files.clear()
+        previous, self.files = self.files, {}
+        self._files_removed = True
         
         try:
-            for filename in os.listdir(folder_path):
-                if filename.lower().endswith('.pdf'):
-                    filepath = os.path.join(folder_path, filename)
-                    self._add_file(filepath)
+            # DirEntry caches its type and stat, so each file is stat'ed once
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    if entry.name.lower().endswith('.pdf') and entry.is_file():
+                        st = entry.stat()
+                        info = previous.get(entry.path)
+                        if (info is not None and info.mtime_ns == st.st_mtime_ns
+                                and info.file_size == st.st_size):
+                            self.files[entry.path] = info
+                        else:
+                            self._add_file(entry.path, st)
+            
+            # Stop reading counts of files no longer listed
+            for file_path in [p for p in self._page_count_jobs if p not in self.files]:
+                self._page_count_jobs.pop(file_path).cancel()
             
             self._refresh_file_list()
         except Exception as e:
             logger.error(f"Error loading folder: {e}")
             messagebox.showerror("Error", f"Failed to load folder:\n{str(e)}")
     
-    def _add_file(self, file_path: str):
+    def _add_file(self, file_path: str, stat_result: Optional[os.stat_result] = None):
         """
         Add a file to the available files.
         
         Args:
             file_path: Path to PDF file
+            stat_result: The file's stat if already known
         """
         if file_path not in self.files:
-            self.files[file_path] = PDFFileInfo(file_path)
+            info = self.files[file_path] = PDFFileInfo(
+                file_path, load_page_count=False, stat_result=stat_result
+            )
+            self._unlisted.append(file_path)
+            if info.page_count is None:
+                self._submit_page_count(info, io_pool)
+    
+    def _submit_page_count(self, info: PDFFileInfo, executor: ThreadPoolExecutor):
+        """
+        Read a file's page count in the background.
+        
+        Args:
+            info: File to count the pages of
+            executor: Pool to read it on
+        """
+        previous_job = self._page_count_jobs.get(info.file_path)
+        if previous_job is not None:
+            # The file was reloaded; its old count is no longer wanted
+            previous_job.cancel()
+        
+        job = executor.submit(info.read_page_count)
+        self._page_count_jobs[info.file_path] = job
+        job.add_done_callback(lambda f, p=info.file_path: self._on_page_count_read(p, f))
+    
+    def _prioritize_page_count(self, info: PDFFileInfo):
+        """
+        Read a file's page count next if it is still waiting in the queue.
+        
+        Used for the selected file, so its count doesn't wait behind the
+        rest of a large folder.
+        
+        Args:
+            info: File whose count is wanted now
+        """
+        job = self._page_count_jobs.get(info.file_path)
+        # Nothing to do if the count is known or already being read
+        if job is not None and job.cancel():
+            self._submit_page_count(info, priority_pool)
+    
+    def _on_page_count_read(self, file_path: str, job: Future):
+        """
+        Hand a finished page count job back to the Tk main loop (worker thread).
+        
+        Results are collected and shown together by _flush_page_counts, so
+        a folder of files costs a few Tk callbacks rather than one per file.
+        """
+        if job.cancelled():
+            return
+        with self._page_count_lock:
+            self._page_count_results.append((file_path, job, job.result()))
+            if len(self._page_count_results) > 1:
+                # A flush is already scheduled
+                return
+        try:
+            self.after(self.PAGE_COUNT_FLUSH_MS, self._flush_page_counts)
+        except (RuntimeError, tk.TclError):
+            # Screen was closed while reading
+            pass
+    
+    def _flush_page_counts(self):
+        """Show the page counts read since the last flush."""
+        with self._page_count_lock:
+            results, self._page_count_results = self._page_count_results, []
+        for file_path, job, page_count in results:
+            self._patch_page_count(file_path, job, page_count)
+    
+    def _patch_page_count(self, file_path: str, job: Future, page_count: int):
+        """
+        Show a page count read in the background.
+        
+        Args:
+            file_path: Path to PDF file
+            job: The job that read it; stale jobs (file reloaded since) are ignored
+            page_count: Number of pages
+        """
+        if self._page_count_jobs.get(file_path) is not job:
+            return
+        del self._page_count_jobs[file_path]
+        
+        info = self.files[file_path]
+        info.page_count = page_count
+        
+        # Update the row and preview label in place
+        if self.file_tree.exists(file_path):
+            self.file_tree.set(file_path, 'pages', page_count)
+        if self.current_preview_file == file_path:
+            self._update_preview_info(info)
+    
+    def _cancel_page_counts(self):
+        """Cancel page count jobs that haven't started."""
+        for job in self._page_count_jobs.values():
+            job.cancel()
+        self._page_count_jobs.clear()
     
     def _refresh_file_list(self):
-        """Refresh the file list display."""
-        # Clear current list
-        self.file_tree.delete(*self.file_tree.get_children())
-        
-        # Add files
-        for file_path, info in sorted(self.files.items(), key=lambda x: x[1].filename):
-            self.file_tree.insert(
-                '',
-                tk.END,
-                iid=file_path,
-                text=info.filename,
-                values=(info.format_size(), info.page_count, info.format_date())
-            )
+        """
+        Bring the file list display in line with self.files.
+        
+        Only rows whose file was removed, added or reloaded are touched;
+        new rows are inserted at their position in the sorted display
+        order, so nothing is re-sorted and unchanged files aren't visited.
+        
+        At most FILE_ROWS_PER_BATCH rows are inserted per call; the rest
+        follow in later Tk callbacks, so a large folder shows its first
+        rows at once and the window stays responsive while it fills.
+        """
+        if self._refresh_after_id is not None:
+            self.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = None
+        
+        # Remove rows for files that are gone
+        if self._files_removed:
+            self._files_removed = False
+            removed = [p for p in self._displayed if p not in self.files]
+            if removed:
+                self.file_tree.delete(*removed)
+                for file_path in removed:
+                    del self._displayed[file_path]
+                self._displayed_order = [
+                    k for k in self._displayed_order if k[1] in self._displayed
+                ]
+        
+        if len(self._unlisted) > self.FILE_ROWS_PER_BATCH:
+            # Fill in display order, so rows shown first stay at the top
+            # (cheap on later batches: the list is already sorted)
+            self._unlisted.sort(key=self._display_key)
+        batch = self._unlisted[:self.FILE_ROWS_PER_BATCH]
+        del self._unlisted[:self.FILE_ROWS_PER_BATCH]
+        for file_path in batch:
+            info = self.files.get(file_path)
+            shown = self._displayed.get(file_path)
+            if info is None or shown is info:
+                continue
+            
+            values = info.row_values()
+            if shown is None:
+                key = self._display_key(file_path)
+                index = bisect_left(self._displayed_order, key)
+                self._displayed_order.insert(index, key)
+                self.file_tree.insert('', index, iid=file_path, text=info.filename, values=values)
+            else:
+                # Same path reloaded (e.g. folder opened again)
+                self.file_tree.item(file_path, values=values)
+            self._displayed[file_path] = info
+        
+        if self._unlisted:
+            self._refresh_after_id = self.after(1, self._refresh_file_list)
     
-    def _on_file_click(self, event):
-        """Handle file click."""
-        # Get selected item
-        item = self.file_tree.identify('item', event.x, event.y)
+    def _display_key(self, file_path: str) -> Tuple[str, str]:
+        """Get the file list sort key of a file: (filename, file_path)."""
+        info = self.files.get(file_path)
+        return (info.filename if info is not None else "", file_path)
+    
+    def _on_file_select(self, event):
+        """Handle file selection by click or arrow keys."""
+        item = self.file_tree.focus()
         if item:
             self._show_preview(item)
     
@@ -605,6 +1003,10 @@ class MergeScreen(ttk.Frame):
         """
         Show preview of a file.
         
+        The file details are shown at once; the thumbnail is rendered
+        PREVIEW_DELAY_MS later, so moving quickly through the list renders
+        only the file the selection stops on.
+        
         Args:
             file_path: Path to PDF file
         """
@@ -613,28 +1015,66 @@ class MergeScreen(ttk.Frame):
         
         self.current_preview_file = file_path
         info = self.files[file_path]
+        if info.page_count is None:
+            self._prioritize_page_count(info)
         
         # Update info label
-        self.preview_info_label.config(
-            text=f"{info.filename}\n{info.format_size()}, {info.page_count} pages"
-        )
+        self._update_preview_info(info)
         
         # Enable full preview button
         self.full_preview_button.config(state=tk.NORMAL)
         
+        if self._preview_after_id is not None:
+            self.after_cancel(self._preview_after_id)
+            self._preview_after_id = None
+        if info.current_thumbnail() is not None:
+            # Already rendered; nothing to debounce
+            self._render_preview(file_path)
+        else:
+            self._preview_after_id = self.after(
+                self.PREVIEW_DELAY_MS, self._render_preview, file_path
+            )
+    
+    def _render_preview(self, file_path: str):
+        """
+        Render the thumbnail of the previewed file.
+        
+        Args:
+            file_path: Path to PDF file
+        """
+        self._preview_after_id = None
+        if file_path != self.current_preview_file:
+            return
+        
+        # Don't rasterize for a minimized window or hidden tab; _on_map
+        # renders it once the preview shows again
+        if not self.preview_canvas.winfo_viewable():
+            self._hidden_preview = file_path
+            return
+        self._hidden_preview = None
+        
         # Load thumbnail
         try:
-            image = self.preview_generator.get_first_page_thumbnail(
-                file_path,
-                max_size=(350, 450)
-            )
+            info = self.files[file_path]
+            photo = info.current_thumbnail()
             
-            if image:
-                photo = ImageTk.PhotoImage(image)
-                
-                # Clear canvas
-                self.preview_canvas.delete("all")
-                
+            # Release the previous thumbnail's photo before the next is created
+            self.preview_canvas.delete("all")
+            self.preview_canvas.image = None
+            
+            if photo is None:
+                # Taken before rendering, so a change during the render
+                # makes the next lookup render again
+                mtime_ns = os.stat(file_path).st_mtime_ns
+                image = self.preview_generator.get_first_page_thumbnail(
+                    file_path,
+                    max_size=(350, 450)
+                )
+                if image:
+                    photo = ImageTk.PhotoImage(image)
+                    self._keep_thumbnail(info, photo, mtime_ns)
+            
+            if photo is not None:
                 # Center image
                 canvas_width = self.preview_canvas.winfo_width()
                 canvas_height = self.preview_canvas.winfo_height()
@@ -650,9 +1090,45 @@ class MergeScreen(ttk.Frame):
             logger.error(f"Error showing preview: {e}")
             self._show_placeholder_preview()
     
+    def _keep_thumbnail(self, info: PDFFileInfo, photo: ImageTk.PhotoImage, mtime_ns: int):
+        """
+        Store a file's thumbnail photo for revisits.
+        
+        Only the last THUMBNAILS_KEPT files keep theirs, bounding the
+        memory held in Tk photos. A photo replacing an out-of-date one
+        keeps the file's place.
+        
+        Args:
+            info: File the thumbnail shows
+            photo: Thumbnail photo
+            mtime_ns: Modification time of the file the photo was rendered from
+        """
+        if info.thumbnail is None:
+            self._thumbnail_infos.append(info)
+        info.thumbnail = photo
+        info.thumbnail_mtime_ns = mtime_ns
+        if len(self._thumbnail_infos) > self.THUMBNAILS_KEPT:
+            self._thumbnail_infos.popleft().thumbnail = None
+    
+    def _on_map(self, event):
+        """Render a preview skipped while the preview was hidden."""
+        if self._hidden_preview is None or not self.preview_canvas.winfo_viewable():
+            return
+        file_path, self._hidden_preview = self._hidden_preview, None
+        # A render already scheduled will show the current file anyway
+        if self._preview_after_id is None:
+            self._render_preview(file_path)
+    
+    def _update_preview_info(self, info: PDFFileInfo):
+        """Show a file's details under the preview."""
+        self.preview_info_label.config(
+            text=f"{info.filename}\n{info.format_size()}, {info.format_pages()} pages"
+        )
+    
     def _show_placeholder_preview(self):
         """Show placeholder when preview cannot be generated."""
         self.preview_canvas.delete("all")
+        self.preview_canvas.image = None
         self.preview_canvas.create_text(
             200, 250,
             text="Preview not available",
@@ -662,7 +1138,12 @@ class MergeScreen(ttk.Frame):
     def _open_full_preview(self):
         """Open full preview dialog."""
         if self.current_preview_file:
-            PreviewDialog(self, self.current_preview_file)
+            info = self.files.get(self.current_preview_file)
+            PreviewDialog(
+                self,
+                self.current_preview_file,
+                total_pages=info.page_count if info is not None else None
+            )
     
     def _add_to_queue(self, file_path: str):
         """
@@ -673,7 +1154,7 @@ class MergeScreen(ttk.Frame):
         """
         if file_path not in self.merge_queue:
             self.merge_queue.append(file_path)
-            self._update_queue_display()
+            self._update_queue_display(len(self.merge_queue) - 1)
     
     def _remove_from_queue(self):
         """Remove selected file from queue."""
@@ -682,18 +1163,15 @@ class MergeScreen(ttk.Frame):
             index = selection[0]
             if index < len(self.merge_queue):
                 self.merge_queue.pop(index)
-                self._update_queue_display()
+                # Rows below move up and are renumbered
+                self._update_queue_display(index)
     
     def _move_up_in_queue(self):
         """Move selected file up in queue."""
         selection = self.queue_listbox.curselection()
         if selection and selection[0] > 0:
             index = selection[0]
-            # Swap items
-            temp = self.merge_queue[index]
-            self.merge_queue[index] = self.merge_queue[index - 1]
-            self.merge_queue[index - 1] = temp
-            self._update_queue_display()
+            self._swap_queue_items(index - 1, index)
             self.queue_listbox.selection_set(index - 1)
     
     def _move_down_in_queue(self):
@@ -701,13 +1179,21 @@ class MergeScreen(ttk.Frame):
         selection = self.queue_listbox.curselection()
         if selection and selection[0] < len(self.merge_queue) - 1:
             index = selection[0]
-            # Swap items
-            temp = self.merge_queue[index]
-            self.merge_queue[index] = self.merge_queue[index + 1]
-            self.merge_queue[index + 1] = temp
-            self._update_queue_display()
+            self._swap_queue_items(index, index + 1)
             self.queue_listbox.selection_set(index + 1)
     
+    def _swap_queue_items(self, upper: int, lower: int):
+        """
+        Swap two adjacent queue items and rewrite just their rows.
+        
+        Args:
+            upper: Index of the upper item
+            lower: Index of the lower item (upper + 1)
+        """
+        queue = self.merge_queue
+        queue[upper], queue[lower] = queue[lower], queue[upper]
+        self._update_queue_display(upper, lower)
+    
     def _clear_queue(self):
         """Clear the merge queue."""
         if self.merge_queue and messagebox.askyesno(
@@ -717,17 +1203,37 @@ class MergeScreen(ttk.Frame):
             self.merge_queue.clear()
             self._update_queue_display()
     
-    def _update_queue_display(self):
-        """Update the queue listbox display."""
-        self.queue_listbox.delete(0, tk.END)
+    def _update_queue_display(self, first: int = 0, last: Optional[int] = None):
+        """
+        Update the queue listbox display.
         
-        for i, file_path in enumerate(self.merge_queue, 1):
-            filename = os.path.basename(file_path)
-            self.queue_listbox.insert(tk.END, f"{i}. {filename}")
+        Only the rows that changed are replaced, in one delete and one
+        insert call.
         
-        # Enable/disable merge button
+        Args:
+            first: Index of the first queue row to rewrite
+            last: Index of the last queue row to rewrite; None rewrites
+                to the end of the queue (and drops rows past it)
+        """
+        end = len(self.merge_queue) if last is None else last + 1
+        self.queue_listbox.delete(first, tk.END if last is None else last)
+        self.queue_listbox.insert(first, *(
+            f"{i}. {self._queue_filename(file_path)}"
+            for i, file_path in enumerate(self.merge_queue[first:end], first + 1)
+        ))
+        
+        self._update_merge_button()
+    
+    def _queue_filename(self, file_path: str) -> str:
+        """Get the name shown for a queued file, reusing its PDFFileInfo's."""
+        info = self.files.get(file_path)
+        # Queued files stay queued when another folder is loaded
+        return info.filename if info is not None else os.path.basename(file_path)
+    
+    def _update_merge_button(self):
+        """Enable the merge button if 2+ files are queued and no merge is running."""
         self.merge_button.config(
-            state=tk.NORMAL if len(self.merge_queue) >= 2 else tk.DISABLED
+            state=tk.NORMAL if len(self.merge_queue) >= 2 and not self._merging else tk.DISABLED
         )
     
     def _execute_merge(self):
@@ -737,7 +1243,7 @@ class MergeScreen(ttk.Frame):
             return
         
         # Generate default filename from first file
-        first_file = os.path.basename(self.merge_queue[0])
+        first_file = self._queue_filename(self.merge_queue[0])
         default_name = os.path.splitext(first_file)[0]
         
         # Show naming dialog
@@ -756,6 +1262,7 @@ class MergeScreen(ttk.Frame):
             
             # Ask for save directory
             output_dir = filedialog.askdirectory(
+                parent=self.winfo_toplevel(),
                 title="Select Output Directory",
                 mustexist=True
             )
@@ -773,49 +1280,9 @@ class MergeScreen(ttk.Frame):
                 ):
                     return False
             
-            # Perform merge
-            try:
-                merger = PDFMerger()
-                
-                # Add files in queue order
-                for file_path in self.merge_queue:
-                    merger.add_pdf(file_path)
-                
-                # Merge
-                result = merger.merge(output_file)
-                
-                if result:
-                    # Check if user wants to delete source files
-                    delete_sources = config.get("merge.delete_source_after_merge", False)
-                    if delete_sources:
-                        if messagebox.askyesno(
-                            "Delete Source Files",
-                            "Merge successful. Delete source files?"
-                        ):
-                            self._delete_source_files()
-                    
-                    # Log the merge operation
-                    self._log_merge_operation(output_file)
-                    
-                    messagebox.showinfo(
-                        "Success",
-                        f"Successfully merged {len(self.merge_queue)} PDFs!\n\n"
-                        f"Output: {output_file}"
-                    )
-                    
-                    # Ask if user wants to clear queue
-                    if messagebox.askyesno("Clear Queue", "Clear the merge queue?"):
-                        self.merge_queue.clear()
-                        self._update_queue_display()
-                    
-                    return True
-                else:
-                    messagebox.showerror("Error", "Merge operation failed")
-                    return False
-            except Exception as e:
-                logger.error(f"Merge failed: {e}")
-                messagebox.showerror("Error", f"Failed to merge PDFs:\n{str(e)}")
-                return False
+            # Merge in the background; the result is reported when it's done
+            self._start_merge(list(self.merge_queue), output_file)
+            return True
         
         # Show naming dialog with callback
         result = show_naming_dialog(
@@ -825,12 +1292,112 @@ class MergeScreen(ttk.Frame):
             on_save=save_callback
         )
     
-    def _delete_source_files(self) -> None:
-        """Delete source files after successful merge."""
+    def _start_merge(self, file_paths: List[str], output_file: str):
+        """
+        Start merging files on a background thread.
+        
+        Args:
+            file_paths: Files to merge, in order
+            output_file: Path for the merged PDF
+        """
+        self._merging = True
+        self._update_merge_button()
+        self.merge_progress.config(maximum=len(file_paths) + 1, value=0)
+        self.merge_progress.pack(fill=tk.X, pady=2)
+        
+        merge_pool.submit(self._run_merge, file_paths, output_file)
+    
+    def _run_merge(self, file_paths: List[str], output_file: str):
+        """
+        Merge files and report progress and the result to the UI (worker thread).
+        
+        Args:
+            file_paths: Files to merge, in order
+            output_file: Path for the merged PDF
+        """
+        try:
+            merger = PDFMerger()
+            
+            # Add files in queue order
+            for done, file_path in enumerate(file_paths, 1):
+                merger.add_pdf(file_path)
+                self._post_to_ui(self.merge_progress.config, value=done)
+            
+            result = merger.merge(output_file)
+            self._post_to_ui(self._merge_finished, file_paths, output_file, result)
+        except Exception as e:
+            logger.error(f"Merge failed: {e}")
+            self._post_to_ui(self._merge_finished, file_paths, output_file, False, e)
+    
+    def _post_to_ui(self, callback, *args, **kwargs):
+        """Run a callback on the Tk main loop (from a worker thread)."""
+        try:
+            self.after(0, partial(callback, *args, **kwargs))
+        except (RuntimeError, tk.TclError):
+            # Screen was closed in the meantime
+            pass
+    
+    def _merge_finished(
+        self,
+        file_paths: List[str],
+        output_file: str,
+        result: bool,
+        error: Optional[Exception] = None
+    ):
+        """
+        Report the result of a background merge.
+        
+        Args:
+            file_paths: Files that were merged, in order
+            output_file: Path for the merged PDF
+            result: True if the merged PDF was written
+            error: Exception raised while merging, if any
+        """
+        self._merging = False
+        self.merge_progress.pack_forget()
+        self._update_merge_button()
+        
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to merge PDFs:\n{str(error)}")
+            return
+        if not result:
+            messagebox.showerror("Error", "Merge operation failed")
+            return
+        
+        # Check if user wants to delete source files
+        delete_sources = config.get("merge.delete_source_after_merge", False)
+        if delete_sources:
+            if messagebox.askyesno(
+                "Delete Source Files",
+                "Merge successful. Delete source files?"
+            ):
+                self._delete_source_files(file_paths)
+        
+        # Log the merge operation
+        self._log_merge_operation(output_file, file_paths)
+        
+        messagebox.showinfo(
+            "Success",
+            f"Successfully merged {len(file_paths)} PDFs!\n\n"
+            f"Output: {output_file}"
+        )
+        
+        # Ask if user wants to clear queue
+        if self.merge_queue and messagebox.askyesno("Clear Queue", "Clear the merge queue?"):
+            self.merge_queue.clear()
+            self._update_queue_display()
+    
+    def _delete_source_files(self, file_paths: List[str]) -> None:
+        """
+        Delete source files after successful merge.
+        
+        Args:
+            file_paths: Source files of the merge
+        """
         deleted = 0
         failed = []
         
-        for file_path in self.merge_queue:
+        for file_path in file_paths:
             try:
                 os.remove(file_path)
                 deleted += 1
@@ -848,12 +1415,13 @@ class MergeScreen(ttk.Frame):
         else:
             logger.info(f"Successfully deleted {deleted} source files")
     
-    def _log_merge_operation(self, output_file: str) -> None:
+    def _log_merge_operation(self, output_file: str, file_paths: List[str]) -> None:
         """
         Log merge operation to file.
         
         Args:
             output_file: Path to merged output file
+            file_paths: Source files of the merge, in order
         """
         try:
             # Get log file location from config or use default
@@ -865,18 +1433,56 @@ class MergeScreen(ttk.Frame):
             
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             
-            with open(log_file, "a", encoding="utf-8") as f:
-                f.write(f"\n{'='*80}\n")
-                f.write(f"Merge Date: {timestamp}\n")
-                f.write(f"Output File: {output_file}\n")
-                f.write(f"Source Files ({len(self.merge_queue)}):\n")
-                for i, file_path in enumerate(self.merge_queue, 1):
-                    f.write(f"  {i}. {file_path}\n")
-                f.write(f"{'='*80}\n")
+            lines = [
+                f"\n{'='*80}",
+                f"Merge Date: {timestamp}",
+                f"Output File: {output_file}",
+                f"Source Files ({len(file_paths)}):",
+            ]
+            lines.extend(f"  {i}. {file_path}" for i, file_path in enumerate(file_paths, 1))
+            lines.append(f"{'='*80}\n")
+            entry = "\n".join(lines).encode("utf-8")
+            
+            # Keep the log open between merges; reopen if the configured path changed
+            if self._merge_log is None or self._merge_log_path != log_file:
+                self._close_merge_log()
+                self._merge_log = open(log_file, "ab", buffering=8192)
+                self._merge_log_path = log_file
+            
+            # One write per entry, flushed so the log is complete after each merge
+            self._merge_log.write(entry)
+            self._merge_log.flush()
             
             logger.info(f"Logged merge operation to {log_file}")
         except Exception as e:
             logger.error(f"Failed to log merge operation: {e}")
+            self._close_merge_log()
+    
+    def _close_merge_log(self) -> None:
+        """Close the merge history log if it is open."""
+        if self._merge_log is not None:
+            try:
+                self._merge_log.close()
+            except OSError as e:
+                logger.error(f"Failed to close merge history log: {e}")
+            self._merge_log = None
+            self._merge_log_path = None
+    
+    def destroy(self):
+        """Stop pending previews and page counting, and save cached counts before closing."""
+        if DEPENDENCIES_AVAILABLE:
+            if self._preview_after_id is not None:
+                self.after_cancel(self._preview_after_id)
+                self._preview_after_id = None
+            if self._refresh_after_id is not None:
+                self.after_cancel(self._refresh_after_id)
+                self._refresh_after_id = None
+            # The toplevel's <Map> binding may outlive the screen
+            self._hidden_preview = None
+            self._cancel_page_counts()
+            self._close_merge_log()
+        page_count_cache.save()
+        super().destroy()
 
 
 def show_merge_screen(parent=None):
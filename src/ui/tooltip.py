@@ -5,72 +5,97 @@ Provides simple hover tooltips for UI elements.
 """
 
 import tkinter as tk
+import weakref
 from typing import Optional
 
 
+# Bind tag added to every widget with a tooltip; the hover bindings live on
+# this tag once per application instead of on each widget
+_BINDTAG = "ToolTip"
+
+
 class ToolTip:
     """
-    Create a tooltip for a given widget.
+    Show hover tooltips for widgets registered with create_tooltip.
+    
+    One instance per Tk application handles the hover events of every
+    tooltip widget through a shared bind tag. Each widget carries its own
+    text and delay as the tooltip_text and tooltip_delay attributes. The
+    tooltip window is created once, then moved, re-labelled and shown or
+    withdrawn on each hover.
     
     Usage:
         button = ttk.Button(root, text="Click me")
-        ToolTip(button, "This is a helpful tooltip")
+        create_tooltip(button, "This is a helpful tooltip")
     """
     
-    def __init__(self, widget: tk.Widget, text: str, delay: int = 500):
+    _instances: "weakref.WeakKeyDictionary[tk.Misc, ToolTip]" = weakref.WeakKeyDictionary()
+    
+    def __init__(self, root: tk.Misc):
         """
-        Initialize tooltip.
+        Initialize tooltip handling for an application.
         
         Args:
-            widget: The widget to attach tooltip to
-            text: Tooltip text to display
-            delay: Delay in milliseconds before showing tooltip
+            root: Root window of the application
         """
-        self.widget = widget
-        self.text = text
-        self.delay = delay
+        self.root = root
+        self.widget: Optional[tk.Widget] = None
         self.tip_window: Optional[tk.Toplevel] = None
-        self.schedule_id: Optional[int] = None
+        self.tip_text = tk.StringVar(root)
+        self.schedule_id: Optional[str] = None
         
         # Bind events
-        self.widget.bind("<Enter>", self._on_enter)
-        self.widget.bind("<Leave>", self._on_leave)
-        self.widget.bind("<Button>", self._on_leave)  # Hide on click
+        root.bind_class(_BINDTAG, "<Enter>", self._on_enter)
+        root.bind_class(_BINDTAG, "<Leave>", self._on_leave)
+        root.bind_class(_BINDTAG, "<Button>", self._on_leave)  # Hide on click
+    
+    @classmethod
+    def get_singleton(cls, widget: tk.Misc) -> "ToolTip":
+        """
+        Get the tooltip handler for a widget's application, creating it on first use.
+        
+        Args:
+            widget: Any widget of the application
+        
+        Returns:
+            ToolTip instance shared by the application
+        """
+        root = widget._root()
+        instance = cls._instances.get(root)
+        if instance is None:
+            instance = cls._instances[root] = cls(root)
+        return instance
     
-    def _on_enter(self, event=None):
+    def _on_enter(self, event):
         """Handle mouse enter event."""
         self._cancel_schedule()
-        self.schedule_id = self.widget.after(self.delay, self._show_tip)
+        self._hide_tip()
+        self.widget = event.widget
+        delay = getattr(self.widget, 'tooltip_delay', 500)
+        self.schedule_id = self.root.after(delay, self._show_tip)
     
     def _on_leave(self, event=None):
         """Handle mouse leave event."""
         self._cancel_schedule()
         self._hide_tip()
+        self.widget = None
     
     def _cancel_schedule(self):
         """Cancel scheduled tooltip display."""
         if self.schedule_id:
-            self.widget.after_cancel(self.schedule_id)
+            self.root.after_cancel(self.schedule_id)
             self.schedule_id = None
     
-    def _show_tip(self):
-        """Display the tooltip."""
-        if self.tip_window or not self.text:
-            return
-        
-        # Get widget position
-        x = self.widget.winfo_rootx() + 20
-        y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5
-        
-        # Create tooltip window
-        self.tip_window = tk.Toplevel(self.widget)
+    def _create_tip_window(self):
+        """Create the hidden tooltip window shared by all widgets."""
+        self.tip_window = tk.Toplevel(self.root)
+        self.tip_window.withdraw()
         self.tip_window.wm_overrideredirect(True)  # Remove window decorations
-        self.tip_window.wm_geometry(f"+{x}+{y}")
         
-        # Create label with tooltip text
+        # Create label showing the current tooltip text
         label = tk.Label(
             self.tip_window,
-            text=self.text,
+            textvariable=self.tip_text,
             justify=tk.LEFT,
             background="#ffffe0",
             relief=tk.SOLID,
@@ -81,23 +106,52 @@ class ToolTip:
         )
         label.pack()
     
+    def _show_tip(self):
+        """Display the tooltip."""
+        self.schedule_id = None
+        text = getattr(self.widget, 'tooltip_text', None)
+        if not text:
+            return
+        
+        if self.tip_window is None or not self.tip_window.winfo_exists():
+            self._create_tip_window()
+        
+        # Get widget position
+        x = self.widget.winfo_rootx() + 20
+        y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5
+        
+        self.tip_text.set(text)
+        self.tip_window.wm_geometry(f"+{x}+{y}")
+        self.tip_window.deiconify()
+        self.tip_window.lift()
+    
     def _hide_tip(self):
         """Hide the tooltip."""
-        if self.tip_window:
-            self.tip_window.destroy()
-            self.tip_window = None
+        if self.tip_window is not None and self.tip_window.winfo_exists():
+            self.tip_window.withdraw()
 
 
 def create_tooltip(widget: tk.Widget, text: str, delay: int = 500) -> ToolTip:
     """
     Helper function to create a tooltip.
     
+    Stores the text on the widget and adds the shared tooltip bind tag to
+    it; calling it again for the same widget just updates the text.
+    
     Args:
         widget: The widget to attach tooltip to
         text: Tooltip text to display
         delay: Delay in milliseconds before showing tooltip
-        
+    
     Returns:
-        ToolTip instance
+        ToolTip instance handling the widget's application
     """
-    return ToolTip(widget, text, delay)
+    widget.tooltip_text = text
+    widget.tooltip_delay = delay
+    
+    tags = widget.bindtags()
+    if _BINDTAG not in tags:
+        # Right after the widget's own tag, where widget bindings would run
+        widget.bindtags(tags[:1] + (_BINDTAG,) + tags[1:])
+    
+    return ToolTip.get_singleton(widget)
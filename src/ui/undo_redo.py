@@ -4,12 +4,56 @@ Undo/Redo functionality for PDF rotation operations.
 Maintains a history of rotation operations and allows undoing/redoing them.
 """
 
-from typing import List, Optional, Tuple
-from dataclasses import dataclass
+import json
+import shutil
+import time
+from typing import IO, Iterable, List, Optional, Tuple
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from ..utils.logger import logger
 
 
+def get_session_log_path(session_id: str = "default") -> Path:
+    """
+    Get the path of the persisted undo log for a session.
+    
+    Args:
+        session_id: Session identifier
+        
+    Returns:
+        Path to ~/.pdf-manipulate/session-<id>/operations.jsonl
+    """
+    return Path.home() / ".pdf-manipulate" / f"session-{session_id}" / "operations.jsonl"
+
+
+def prune_session_logs(keep_session_id: str = "default", max_age_days: int = 30) -> int:
+    """
+    Delete undo logs of other sessions that haven't been written to lately.
+    
+    Args:
+        keep_session_id: Session whose log is never deleted
+        max_age_days: Age in days after which another session's log is deleted
+        
+    Returns:
+        Number of session directories deleted
+    """
+    keep = get_session_log_path(keep_session_id).parent
+    cutoff = time.time() - max_age_days * 86400
+    deleted = 0
+    try:
+        for session_dir in keep.parent.glob("session-*"):
+            if session_dir == keep or not session_dir.is_dir():
+                continue
+            log_file = session_dir / "operations.jsonl"
+            last_written = (log_file if log_file.exists() else session_dir).stat().st_mtime
+            if last_written < cutoff:
+                shutil.rmtree(session_dir)
+                deleted += 1
+    except OSError as e:
+        logger.warning(f"Could not prune old undo logs: {e}")
+    return deleted
+
+
 @dataclass
 class RotationAction:
     """Represents a single rotation action that can be undone/redone."""
@@ -23,6 +67,22 @@ class RotationAction:
         """String representation."""
         return (f"Rotate page {self.page_num} of {self.pdf_path.name} "
                 f"from {self.old_rotation}° to {self.new_rotation}°")
+    
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serializable dictionary."""
+        data = asdict(self)
+        data["pdf_path"] = str(self.pdf_path)
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "RotationAction":
+        """Create an action from a dictionary produced by to_dict."""
+        return cls(
+            pdf_path=Path(data["pdf_path"]),
+            page_num=int(data["page_num"]),
+            old_rotation=int(data["old_rotation"]),
+            new_rotation=int(data["new_rotation"]),
+        )
 
 
 class UndoRedoManager:
@@ -35,18 +95,103 @@ class UndoRedoManager:
     - Redoing undone action
     - Clearing history
     - Getting history info
+    - Optionally persisting the undo history to a JSONL file
     """
     
-    def __init__(self, max_history: int = 50):
+    def __init__(self, max_history: int = 50, log_file: Optional[Path] = None):
         """
         Initialize undo/redo manager.
         
         Args:
             max_history: Maximum number of actions to keep in history
+            log_file: Optional JSONL file the undo history is persisted to.
+                      Existing entries are loaded on initialization.
         """
         self.max_history = max_history
         self.undo_stack: List[RotationAction] = []
         self.redo_stack: List[RotationAction] = []
+        self.log_file = Path(log_file) if log_file is not None else None
+        self._log_handle: Optional[IO[str]] = None
+        # Persisted actions on files not in use, set aside by restrict_to_files
+        self._held: List[RotationAction] = []
+        
+        if self.log_file is not None:
+            self._load_log()
+    
+    def _load_log(self) -> None:
+        """Load persisted undo history (best-effort)."""
+        try:
+            if self.log_file.exists():
+                with open(self.log_file, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        line = line.strip()
+                        if line:
+                            self.undo_stack.append(RotationAction.from_dict(json.loads(line)))
+                del self.undo_stack[:-self.max_history]
+                logger.info(f"Loaded {len(self.undo_stack)} actions from {self.log_file}")
+        except Exception as e:
+            logger.error(f"Error loading undo log: {e}")
+            self.undo_stack.clear()
+    
+    def _append_log(self, action: RotationAction) -> None:
+        """Append an action to the persisted undo log (best-effort)."""
+        if self.log_file is None:
+            return
+        try:
+            if self._log_handle is None:
+                self.log_file.parent.mkdir(parents=True, exist_ok=True)
+                self._log_handle = open(self.log_file, 'a', encoding='utf-8')
+            json.dump(action.to_dict(), self._log_handle)
+            self._log_handle.write('\n')
+            self._log_handle.flush()
+        except Exception as e:
+            logger.error(f"Error writing undo log: {e}")
+    
+    def _rewrite_log(self) -> None:
+        """Rewrite the persisted undo log from the current undo stack (best-effort)."""
+        if self.log_file is None:
+            return
+        self.close()
+        actions = self._held + self.undo_stack
+        if not actions and not self.log_file.exists():
+            # Nothing logged yet; don't create an empty log
+            return
+        try:
+            self.log_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.log_file, 'w', encoding='utf-8') as f:
+                for action in actions:
+                    json.dump(action.to_dict(), f)
+                    f.write('\n')
+        except Exception as e:
+            logger.error(f"Error writing undo log: {e}")
+    
+    def close(self) -> None:
+        """Close the persisted undo log file handle, if open."""
+        if self._log_handle is not None:
+            try:
+                self._log_handle.close()
+            except Exception as e:
+                logger.error(f"Error closing undo log: {e}")
+            self._log_handle = None
+    
+    def restrict_to_files(self, files: Iterable[Path]) -> None:
+        """
+        Limit undo/redo to actions on the given files.
+        
+        Actions on other files, such as those loaded from the log of an
+        earlier run, are set aside rather than dropped. They stay in the
+        persisted log and return to the undo stack once their file is
+        passed in again.
+        
+        Args:
+            files: PDF files currently in use
+        """
+        files = {Path(f).resolve() for f in files}
+        actions = self._held + self.undo_stack
+        in_use = [action.pdf_path.resolve() in files for action in actions]
+        self._held = [a for a, used in zip(actions, in_use) if not used]
+        self.undo_stack = [a for a, used in zip(actions, in_use) if used]
+        self.redo_stack = [a for a in self.redo_stack if a.pdf_path.resolve() in files]
     
     def add_action(self, action: RotationAction) -> None:
         """
@@ -60,6 +205,9 @@ class UndoRedoManager:
         # Trim history if needed
         if len(self.undo_stack) > self.max_history:
             self.undo_stack.pop(0)
+            self._rewrite_log()
+        else:
+            self._append_log(action)
         
         # Clear redo stack when new action is added
         self.redo_stack.clear()
@@ -97,6 +245,7 @@ class UndoRedoManager:
         
         action = self.undo_stack.pop()
         self.redo_stack.append(action)
+        self._rewrite_log()
         
         logger.info(f"Undoing: {action}")
         return action
@@ -114,14 +263,17 @@ class UndoRedoManager:
         
         action = self.redo_stack.pop()
         self.undo_stack.append(action)
+        self._append_log(action)
         
         logger.info(f"Redoing: {action}")
         return action
     
     def clear(self) -> None:
-        """Clear all undo/redo history."""
+        """Clear all undo/redo history, including actions set aside."""
         self.undo_stack.clear()
         self.redo_stack.clear()
+        self._held.clear()
+        self._rewrite_log()
         logger.debug("Cleared undo/redo history")
     
     def get_undo_description(self) -> Optional[str]:
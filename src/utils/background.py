@@ -0,0 +1,24 @@
+"""
+Shared thread pools for background work.
+
+Screens and dialogs submit file reads, page renders and merges to these
+pools instead of starting threads or pools of their own, so the number of
+worker threads stays bounded however many windows are open.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Number of threads reading and rendering PDFs at once
+IO_WORKERS = 8
+
+# Page counts, page renders and log reads
+io_pool = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="pdfio")
+
+# A worker kept free for work the user is waiting on right now (such as the
+# selected file's page count), so it doesn't queue behind a large folder
+priority_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdfio-priority")
+
+# Merges, which run long; on a lane of their own so they neither wait behind
+# a folder's queued page counts nor hold up the workers reading them
+merge_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdfio-merge")
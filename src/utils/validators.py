@@ -20,8 +20,8 @@ def is_valid_pdf(file_path: Union[str, Path]) -> bool:
     """
     path = Path(file_path)
 
-    # Check if file exists
-    if not path.exists() or not path.is_file():
+    # Check if file exists (is_file() is False for missing paths; one stat)
+    if not path.is_file():
         return False
 
     # Check file extension
@@ -0,0 +1,58 @@
+"""
+Tests for the persistent page count cache.
+"""
+
+import pytest
+from src.pdf_operations.page_count_cache import PageCountCache
+
+
+class TestPageCountCache:
+    """Test page count caching."""
+    
+    def test_get_missing(self, tmp_path):
+        """Test that unknown files are not cached."""
+        cache = PageCountCache(tmp_path / "counts.json")
+        assert cache.get("a.pdf", 1, 100) is None
+    
+    def test_put_and_get(self, tmp_path):
+        """Test storing and reading back a page count."""
+        cache = PageCountCache(tmp_path / "counts.json")
+        cache.put("a.pdf", 1, 100, 12)
+        assert cache.get("a.pdf", 1, 100) == 12
+    
+    def test_changed_file_not_returned(self, tmp_path):
+        """Test that a count is ignored once the file's mtime or size changes."""
+        cache = PageCountCache(tmp_path / "counts.json")
+        cache.put("a.pdf", 1, 100, 12)
+        assert cache.get("a.pdf", 2, 100) is None
+        assert cache.get("a.pdf", 1, 101) is None
+    
+    def test_save_and_reload(self, tmp_path):
+        """Test that counts persist across instances."""
+        cache_file = tmp_path / "counts.json"
+        cache = PageCountCache(cache_file)
+        cache.put("a.pdf", 1, 100, 12)
+        assert cache.save()
+        assert cache_file.exists()
+        
+        reloaded = PageCountCache(cache_file)
+        assert reloaded.get("a.pdf", 1, 100) == 12
+    
+    def test_flush_every(self, tmp_path):
+        """Test that the cache is written after flush_every new entries."""
+        cache_file = tmp_path / "counts.json"
+        cache = PageCountCache(cache_file, flush_every=2)
+        cache.put("a.pdf", 1, 100, 1)
+        assert not cache_file.exists()
+        cache.put("b.pdf", 1, 100, 2)
+        assert cache_file.exists()
+    
+    def test_max_entries(self, tmp_path, monkeypatch):
+        """Test that the oldest entries are dropped past MAX_ENTRIES."""
+        monkeypatch.setattr(PageCountCache, "MAX_ENTRIES", 2)
+        cache = PageCountCache(tmp_path / "counts.json")
+        cache.put("a.pdf", 1, 100, 1)
+        cache.put("b.pdf", 1, 100, 2)
+        cache.put("c.pdf", 1, 100, 3)
+        assert cache.get("a.pdf", 1, 100) is None
+        assert cache.get("c.pdf", 1, 100) == 3
@@ -36,6 +36,23 @@ class TestPreferencesManager:
         assert prefs2.get("window.width") == 1400
         assert prefs2.get("test_key") == "test_value"
     
+    def test_save_skips_unchanged(self, tmp_path):
+        """Test that saving unchanged preferences doesn't rewrite the file."""
+        pref_file = tmp_path / "prefs.json"
+        prefs = PreferencesManager(pref_file)
+        prefs.set("test_key", "test_value")
+        assert prefs.save()
+        
+        # Mark the file so a rewrite would be detected
+        pref_file.write_text(pref_file.read_text() + " ")
+        assert prefs.save()
+        assert pref_file.read_text().endswith(" ")
+        
+        prefs.set("test_key", "other_value")
+        assert prefs.save()
+        assert json.loads(pref_file.read_text())["test_key"] == "other_value"
+        assert not (tmp_path / "prefs.json.tmp").exists()
+    
     def test_get_with_default(self, tmp_path):
         """Test get with default value."""
         pref_file = tmp_path / "prefs.json"
@@ -101,6 +118,28 @@ class TestPreferencesManager:
         recent = prefs.get_recent_files()
         assert len(recent) == 1
     
+    def test_add_recent_files_matches_single_adds(self, tmp_path):
+        """Test that a bulk add gives the same list as adding one by one."""
+        files = []
+        for i in range(12):
+            file = tmp_path / f"test{i}.pdf"
+            file.touch()
+            files.append(file)
+        
+        single = PreferencesManager(tmp_path / "single.json")
+        bulk = PreferencesManager(tmp_path / "bulk.json")
+        for prefs in (single, bulk):
+            prefs.add_recent_file(files[3])
+            prefs.add_recent_file(files[11])
+        
+        batch = files[:10] + [files[3]]
+        for file in batch:
+            single.add_recent_file(file)
+        bulk.add_recent_files(batch)
+        
+        assert bulk.get_recent_files() == single.get_recent_files()
+        assert bulk.get_recent_files()[0] == str(files[3].absolute())
+    
     def test_get_recent_files_filters_missing(self, tmp_path):
         """Test that missing files are filtered out."""
         pref_file = tmp_path / "prefs.json"
@@ -11,6 +11,7 @@ from PIL import Image
 from src.pdf_operations.preview import (
     PreviewCache,
     PDFPreviewGenerator,
+    PYMUPDF_AVAILABLE,
     create_blank_thumbnail
 )
 
@@ -161,6 +162,24 @@ class TestPDFPreviewGenerator:
         result2 = generator.generate_thumbnail("test.pdf", 0, use_cache=False)
         assert generator._generate_with_pymupdf.call_count == 2
     
+    @patch('src.pdf_operations.preview.PYMUPDF_AVAILABLE', True)
+    def test_cache_invalidated_when_file_changes(self, tmp_path):
+        """Test that a rewritten file isn't served from the cache."""
+        pdf_path = tmp_path / "test.pdf"
+        pdf_path.write_bytes(b"%PDF-")
+        
+        generator = PDFPreviewGenerator()
+        generator._generate_with_pymupdf = Mock(return_value=Image.new('RGB', (100, 100)))
+        
+        generator.generate_thumbnail(str(pdf_path), 0)
+        generator.generate_thumbnail(str(pdf_path), 0)
+        assert generator._generate_with_pymupdf.call_count == 1
+        
+        mtime_ns = pdf_path.stat().st_mtime_ns
+        os.utime(pdf_path, ns=(mtime_ns, mtime_ns + 1_000_000_000))
+        generator.generate_thumbnail(str(pdf_path), 0)
+        assert generator._generate_with_pymupdf.call_count == 2
+    
     @patch('src.pdf_operations.preview.PYMUPDF_AVAILABLE', True)
     def test_thumbnail_resize(self):
         """Test that thumbnails are resized correctly."""
@@ -182,6 +201,23 @@ class TestPDFPreviewGenerator:
         assert result.width <= 200
         assert result.height <= 200
     
+    @pytest.mark.skipif(not PYMUPDF_AVAILABLE, reason="PyMuPDF not installed")
+    def test_pymupdf_render_fits_max_size(self, tmp_path):
+        """Test that PyMuPDF renders thumbnails at the size that fits max_size."""
+        import fitz
+        pdf_path = str(tmp_path / "page.pdf")
+        doc = fitz.open()
+        doc.new_page(width=612, height=792)
+        doc.save(pdf_path)
+        doc.close()
+        
+        generator = PDFPreviewGenerator()
+        image = generator._generate_with_pymupdf(pdf_path, 0, dpi=72, max_size=(200, 200))
+        
+        assert image is not None
+        assert image.height == 200
+        assert image.width < 200
+    
     @patch('src.pdf_operations.preview.PYMUPDF_AVAILABLE', True)
     def test_clear_cache(self):
         """Test clearing the cache."""
@@ -2,9 +2,11 @@
 Tests for undo/redo manager.
 """
 
+import os
+import time
 import pytest
 from pathlib import Path
-from src.ui.undo_redo import UndoRedoManager, RotationAction
+from src.ui.undo_redo import UndoRedoManager, RotationAction, prune_session_logs
 
 
 class TestUndoRedoManager:
@@ -188,3 +190,80 @@ class TestUndoRedoManager:
         assert "test.pdf" in str_repr
         assert "0°" in str_repr
         assert "90°" in str_repr
+    
+    def test_persisted_log_roundtrip(self, tmp_path):
+        """Test that history is reloaded from the JSONL log."""
+        log_file = tmp_path / "session-test" / "operations.jsonl"
+        manager = UndoRedoManager(log_file=log_file)
+        
+        actions = [RotationAction(Path(f"test{i}.pdf"), i, 0, 90) for i in range(3)]
+        for action in actions:
+            manager.add_action(action)
+        manager.undo()
+        manager.close()
+        
+        reloaded = UndoRedoManager(log_file=log_file)
+        assert reloaded.get_all_actions() == actions[:2]
+    
+    def test_persisted_log_capped(self, tmp_path):
+        """Test that the JSONL log is bounded by max_history."""
+        log_file = tmp_path / "operations.jsonl"
+        manager = UndoRedoManager(max_history=5, log_file=log_file)
+        
+        for i in range(10):
+            manager.add_action(RotationAction(Path(f"test{i}.pdf"), i, 0, 90))
+        manager.close()
+        
+        assert len(log_file.read_text(encoding="utf-8").splitlines()) == 5
+        assert UndoRedoManager(max_history=5, log_file=log_file).get_history_size() == (5, 0)
+    
+    def test_clear_truncates_log(self, tmp_path):
+        """Test that clearing history truncates the JSONL log."""
+        log_file = tmp_path / "operations.jsonl"
+        manager = UndoRedoManager(log_file=log_file)
+        manager.add_action(RotationAction(Path("test.pdf"), 1, 0, 90))
+        
+        manager.clear()
+        
+        assert log_file.read_text(encoding="utf-8") == ""
+    
+    def test_restrict_to_files_sets_other_actions_aside(self, tmp_path):
+        """Test that actions on files not in use are hidden but kept in the log."""
+        log_file = tmp_path / "operations.jsonl"
+        manager = UndoRedoManager(log_file=log_file)
+        manager.add_action(RotationAction(tmp_path / "a.pdf", 0, 0, 90))
+        manager.add_action(RotationAction(tmp_path / "b.pdf", 0, 0, 90))
+        manager.close()
+        
+        reloaded = UndoRedoManager(log_file=log_file)
+        reloaded.restrict_to_files([])
+        assert not reloaded.can_undo()
+        
+        reloaded.restrict_to_files([tmp_path / "b.pdf"])
+        assert reloaded.undo().pdf_path == tmp_path / "b.pdf"
+        assert not reloaded.can_undo()
+        reloaded.close()
+        
+        # The action on a.pdf survives the rewrite done by undo
+        assert UndoRedoManager(log_file=log_file).get_history_size() == (1, 0)
+    
+    def test_clear_without_history_creates_no_log(self, tmp_path):
+        """Test that clearing an unused history doesn't create a log file."""
+        log_file = tmp_path / "session-test" / "operations.jsonl"
+        UndoRedoManager(log_file=log_file).clear()
+        
+        assert not log_file.parent.exists()
+    
+    def test_prune_session_logs(self, tmp_path, monkeypatch):
+        """Test that only stale logs of other sessions are deleted."""
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        root = tmp_path / ".pdf-manipulate"
+        for name in ("session-default", "session-old", "session-recent"):
+            (root / name).mkdir(parents=True)
+            (root / name / "operations.jsonl").write_text("", encoding="utf-8")
+        old = time.time() - 60 * 86400
+        for name in ("session-default", "session-old"):
+            os.utime(root / name / "operations.jsonl", (old, old))
+        
+        assert prune_session_logs(max_age_days=30) == 1
+        assert sorted(p.name for p in root.iterdir()) == ["session-default", "session-recent"]